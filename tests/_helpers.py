@@ -0,0 +1,236 @@
+"""
+Shared helpers for the VibeCoder-Zero test suite.
+
+A plain module: conftest.py builds the pytest fixtures from it, and the test
+files import it directly, including their ``__main__`` runners, which work
+without pytest installed. ``pytest.ini`` puts ``tests/`` on ``sys.path``.
+
+Temporary directories for the plain runners are created under
+``$VIBECODER_TEST_TMPDIR`` when it is set (e.g. ``/dev/shm``), otherwise in
+the platform default. Under pytest, relocate ``tmp_path`` with ``--basetemp``.
+"""
+
+import contextlib
+import functools
+import importlib
+import inspect
+import io
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+try:
+    import pytest
+except ImportError:  # Plain ``python tests/test_*.py`` runs
+    pytest = None
+
+# Make the repository importable once for every test module (and for the
+# plain runners, which import this module before any ``vibecoder`` import)
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+# Marks tests excluded by ``pytest -m "not slow"``; a no-op without pytest
+slow = pytest.mark.slow if pytest is not None else (lambda func: func)
+
+
+# Passed as ``dir=`` to TemporaryDirectory; None means the platform default
+_TEST_TMP = os.environ.get("VIBECODER_TEST_TMPDIR") or None
+
+
+@contextlib.contextmanager
+def _pushd(target):
+    """Temporarily change the working directory.
+
+    The original directory is held open and restored with ``os.fchdir``, so
+    restoring works even if it was renamed or removed in the meantime.
+    Falls back to path-based restore where ``fchdir`` is unavailable.
+    """
+    if not hasattr(os, "fchdir"):
+        original = os.getcwd()
+        try:
+            os.chdir(target)
+            yield
+        finally:
+            os.chdir(original)
+        return
+
+    fd = os.open(".", os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.chdir(target)
+        yield
+    finally:
+        os.fchdir(fd)
+        os.close(fd)
+
+
+def _runpy_runner(cmd, cwd=None, **kwargs) -> subprocess.CompletedProcess:
+    """``subprocess.run`` stand-in that executes ``[python, script]`` in-process.
+
+    The script runs through ``runpy.run_path`` as ``__main__``; an exception
+    or non-zero ``SystemExit`` becomes ``returncode=1`` with the traceback on
+    stderr. Other keyword arguments (``timeout``, ``text``...) are ignored.
+    """
+    stdout = io.StringIO()
+    returncode, stderr = 0, ""
+    saved_argv = sys.argv
+    sys.argv = list(cmd[1:])
+    try:
+        with contextlib.redirect_stdout(stdout), _pushd(cwd or os.curdir):
+            runpy.run_path(cmd[1], run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            returncode, stderr = 1, traceback.format_exc()
+    except Exception:
+        returncode, stderr = 1, traceback.format_exc()
+    finally:
+        sys.argv = saved_argv
+    return subprocess.CompletedProcess(cmd, returncode, stdout.getvalue(), stderr)
+
+
+# ========== Scaffolding Fixtures ==========
+
+@functools.lru_cache(maxsize=None)
+def _scaffold_cached(spec_key):
+    """Scaffold a project once per ``(name, language, project_type, features)`` key."""
+    from vibecoder.core.scaffolder import ProjectSpec, ProjectScaffolder
+
+    name, language, project_type, features = spec_key
+    spec = ProjectSpec(
+        name=name,
+        description=f"{name} test project",
+        language=language,
+        project_type=project_type,
+        features=list(features)
+    )
+    return tuple(ProjectScaffolder(Path(name)).scaffold(spec))
+
+
+def _make_scaffold_factory(mktemp):
+    """Build a ``factory(name, features, ...)`` returning ``(files, project_dir)``.
+
+    Each distinct spec is scaffolded and written into ``mktemp(name)`` only
+    once. The returned tree is shared, so tests that mutate it must copy it
+    first (e.g. with ``shutil.copytree``).
+    """
+    from vibecoder.core.scaffolder import ProjectScaffolder
+
+    written = {}
+
+    def factory(name, features=("testing",), language="python", project_type="cli"):
+        key = (name, language, project_type, tuple(features))
+        files = _scaffold_cached(key)
+        if key not in written:
+            project_dir = Path(mktemp(name))
+            ProjectScaffolder(project_dir).write_files(list(files))
+            written[key] = project_dir
+        return list(files), written[key]
+
+    return factory
+
+
+@contextlib.contextmanager
+def _plain_scaffolded_cli_project():
+    """``scaffolded_cli_project`` equivalent for runs without pytest."""
+    with tempfile.TemporaryDirectory(dir=_TEST_TMP) as root:
+        yield _make_scaffold_factory(lambda name: tempfile.mkdtemp(prefix=name, dir=root))
+
+
+# ========== Pipeline Fixtures ==========
+
+# Description shared by every test that reads the ``created_project`` result
+CREATED_PROJECT_DESCRIPTION = "Create a simple Python CLI tool"
+
+
+def _create_project(output_dir):
+    """Run a full non-interactive ``VibeCoderPipeline.create`` into ``output_dir``.
+
+    Returns:
+        Tuple of (pipeline, create result dict)
+    """
+    from vibecoder.pipeline import VibeCoderPipeline
+
+    pipeline = VibeCoderPipeline(output_dir=str(output_dir))
+    return pipeline, pipeline.create(CREATED_PROJECT_DESCRIPTION, interactive=False)
+
+
+@contextlib.contextmanager
+def _plain_created_project():
+    """``created_project`` equivalent for runs without pytest."""
+    with tempfile.TemporaryDirectory(dir=_TEST_TMP) as root:
+        yield _create_project(root)
+
+
+# ========== Plain Runner ==========
+
+@contextlib.contextmanager
+def _plain_tmp_path():
+    """``tmp_path`` equivalent for runs without pytest."""
+    with tempfile.TemporaryDirectory(dir=_TEST_TMP) as tmpdir:
+        yield Path(tmpdir)
+
+
+# Context-manager factories standing in for pytest fixtures in ``__main__`` runs
+_PLAIN_FIXTURES = {
+    "scaffolded_cli_project": _plain_scaffolded_cli_project,
+    "created_project": _plain_created_project,
+    "tmp_path": _plain_tmp_path,
+}
+
+
+def _run_one(module_name, test_name):
+    """Import a test module by name and run one test in this process.
+
+    Returns:
+        Tuple of (test_name, passed, formatted traceback or "")
+    """
+    test_func = getattr(importlib.import_module(module_name), test_name)
+    try:
+        with contextlib.ExitStack() as stack:
+            kwargs = {
+                name: stack.enter_context(_PLAIN_FIXTURES[name]())
+                for name in inspect.signature(test_func).parameters
+            }
+            test_func(**kwargs)
+        return test_name, True, ""
+    except Exception:
+        return test_name, False, traceback.format_exc()
+
+
+def _run_parallel(test_functions) -> int:
+    """Run independent test functions across worker processes.
+
+    Each test runs in a worker process, so tests that ``os.chdir`` cannot
+    affect the parent. Returns a process exit code.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    passed = 0
+    failed = 0
+
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(
+                _run_one,
+                os.path.splitext(os.path.basename(fn.__code__.co_filename))[0],
+                fn.__name__
+            )
+            for fn in test_functions
+        ]
+        for future in as_completed(futures):
+            name, ok, tb = future.result()
+            if ok:
+                print(f"✓ {name}")
+                passed += 1
+            else:
+                print(f"✗ {name}")
+                print(tb, end="")
+                failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return 0 if failed == 0 else 1
@@ -0,0 +1,30 @@
+"""
+pytest fixtures for the VibeCoder-Zero test suite.
+
+Only fixtures live here; the helpers behind them, and everything the test
+files import, are in ``_helpers``.
+"""
+
+import pytest
+
+from _helpers import _create_project, _make_scaffold_factory
+
+# Warm the modules every test file shares so collection finds them cached
+from vibecoder.core import scaffolder  # noqa: F401
+from vibecoder.runtime import executor, test_runner  # noqa: F401
+from vibecoder.pipeline import ProjectPipeline, VibeCoderPipeline  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def scaffolded_cli_project(tmp_path_factory):
+    """Session-wide factory of scaffolded, written-to-disk projects."""
+    return _make_scaffold_factory(tmp_path_factory.mktemp)
+
+
+@pytest.fixture(scope="module")
+def created_project(tmp_path_factory):
+    """One ``VibeCoderPipeline.create`` run shared by a test module.
+
+    Yields ``(pipeline, result)``; tests must treat both as read-only.
+    """
+    return _create_project(tmp_path_factory.mktemp("pipe"))
@@ -2,17 +2,17 @@
 Tests for project scaffolding, test runner, and pipeline modules.
 """
 
+import json
 import os
 import sys
-import tempfile
 import shutil
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from _helpers import _runpy_runner, slow
+from vibecoder.core import scaffolder as scaffolder_module
 from vibecoder.core.scaffolder import (
-    ProjectSpec, GeneratedFile, ProjectScaffolder, parse_project_input
+    ProjectSpec, GeneratedFile, ProjectScaffolder, parse_project_input,
+    _compile_template
 )
 from vibecoder.runtime.test_runner import (
     TestRunner, TestStatus, TestResult, DebugLoop, verify_project
@@ -21,6 +21,23 @@ from vibecoder.pipeline import (
     ProjectPipeline, PipelineState, PipelineStage, VibeCoderPipeline
 )
 
+try:
+    import pytest
+except ImportError:  # Plain ``python tests/test_pipeline.py`` runs
+    pytest = None
+
+
+if pytest is not None:
+    @pytest.fixture(autouse=True)
+    def _stub_llm(monkeypatch):
+        """Keep every pipeline test offline: LLM calls return a canned reply."""
+        from vibecoder.llm.client import LLMClient
+        
+        monkeypatch.setattr(
+            LLMClient, "_call",
+            lambda self, mode, system, user: '{"name": "utils", "language": "python"}'
+        )
+
 
 # ========== Scaffolder Tests ==========
 
@@ -71,86 +88,126 @@ def test_parse_project_input_with_docker():
     assert "docker" in spec.features
 
 
-def test_scaffolder_creates_files():
+def test_parse_project_input_matches_whole_words():
+    """Test keywords inside longer words do not change the parsed spec."""
+    spec = parse_project_input("Create a good rapid specification tool")
+    
+    assert spec.language == "python"
+    assert spec.project_type == "cli"
+    assert spec.features == ["testing"]
+
+
+def test_parse_project_input_matches_inflections():
+    """Test plural and inflected keywords still select type and features."""
+    spec = parse_project_input("Create a REST API for containers")
+    assert spec.project_type == "api"
+    assert "docker" in spec.features
+    
+    spec = parse_project_input("Build APIs with Dockerized deployment")
+    assert spec.project_type == "api"
+    assert "docker" in spec.features
+    
+    assert parse_project_input("Python libraries for servers").project_type == "api"
+    assert parse_project_input("Reusable Python packages").project_type == "library"
+    assert parse_project_input("A tool that goes fast").language == "python"
+
+
+def test_parse_project_input_returns_independent_copies():
+    """Test memoized parsing never shares mutable state between callers."""
+    first = parse_project_input("Create a Python CLI tool for copying")
+    first.features.append("mutated")
+    
+    second = parse_project_input("Create a Python CLI tool for copying")
+    
+    assert "mutated" not in second.features
+    assert second == parse_project_input("Create a Python CLI tool for copying")
+
+
+def test_scaffolder_creates_files(scaffolded_cli_project):
     """Test scaffolder generates correct files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec = ProjectSpec(
-            name="test-app",
-            description="Test application",
-            language="python",
-            project_type="cli",
-            features=["testing"]
-        )
-        
-        scaffolder = ProjectScaffolder(Path(tmpdir))
-        files = scaffolder.scaffold(spec)
-        
-        # Should generate multiple files
-        assert len(files) > 0
-        
-        # Check for essential files
-        file_paths = [f.path for f in files]
-        assert 'main.py' in file_paths
-        assert 'README.md' in file_paths
-        assert 'pyproject.toml' in file_paths
+    files, _ = scaffolded_cli_project("test-app")
+    
+    # Should generate multiple files
+    assert len(files) > 0
+    
+    # Check for essential files
+    file_paths = [f.path for f in files]
+    assert 'main.py' in file_paths
+    assert 'README.md' in file_paths
+    assert 'pyproject.toml' in file_paths
 
 
-def test_scaffolder_writes_files():
+def test_scaffolder_writes_files(scaffolded_cli_project):
     """Test scaffolder writes files to disk."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec = ProjectSpec(
-            name="write-test",
-            description="Test file writing",
-            language="python",
-            project_type="cli",
-            features=["testing"]
-        )
-        
-        scaffolder = ProjectScaffolder(Path(tmpdir))
-        files = scaffolder.scaffold(spec)
-        created_paths = scaffolder.write_files(files)
-        
-        # Check files were created
-        assert len(created_paths) > 0
-        for path in created_paths:
-            assert path.exists()
+    files, project_dir = scaffolded_cli_project("write-test")
+    # Plain strings: every Path "/" allocates and re-parses a new object
+    root = str(project_dir)
+    created_paths = [os.path.join(root, f.path) for f in files]
+    
+    # Check files were created
+    assert len(created_paths) > 0
+    
+    # One directory listing per parent instead of one stat per file
+    on_disk = set()
+    for parent in {os.path.dirname(p) for p in created_paths}:
+        on_disk.update(entry.path for entry in os.scandir(parent))
+    missing = set(created_paths) - on_disk
+    assert not missing, missing
+
+
+def test_scaffolder_writes_files_in_parallel(tmp_path):
+    """Test the thread-pool write path produces the same contents and modes."""
+    files = [
+        GeneratedFile(path="run.sh", content="#!/bin/sh\necho hi\n", executable=True),
+        GeneratedFile(path="pkg/__init__.py", content=""),
+        GeneratedFile(path="pkg/core.py", content="VALUE = 'h\u00e9llo'\n"),
+        GeneratedFile(path="docs/notes.md", content="# Notes\n"),
+    ]
+    saved_threshold = scaffolder_module.PARALLEL_WRITE_MIN_FILES
+    scaffolder_module.PARALLEL_WRITE_MIN_FILES = 1
+    try:
+        created = ProjectScaffolder(tmp_path).write_files(files)
+    finally:
+        scaffolder_module.PARALLEL_WRITE_MIN_FILES = saved_threshold
+    
+    assert created == [tmp_path / f.path for f in files]
+    for f in files:
+        assert (tmp_path / f.path).read_bytes() == f.content.encode('utf-8')
+        if os.name == 'posix':
+            mode = (tmp_path / f.path).stat().st_mode
+            assert bool(mode & 0o111) == f.executable, f.path
 
 
-def test_scaffolder_with_ci():
+def test_scaffolder_with_ci(scaffolded_cli_project):
     """Test scaffolder generates CI files when requested."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec = ProjectSpec(
-            name="ci-test",
-            description="Test CI generation",
-            language="python",
-            project_type="cli",
-            features=["testing", "ci"]
-        )
-        
-        scaffolder = ProjectScaffolder(Path(tmpdir))
-        files = scaffolder.scaffold(spec)
-        
-        file_paths = [f.path for f in files]
-        assert '.github/workflows/ci.yml' in file_paths
+    files, _ = scaffolded_cli_project("ci-test", ("testing", "ci"))
+    
+    file_paths = [f.path for f in files]
+    assert '.github/workflows/ci.yml' in file_paths
 
 
-def test_scaffolder_with_docker():
+def test_scaffolder_with_docker(scaffolded_cli_project):
     """Test scaffolder generates Docker files when requested."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec = ProjectSpec(
-            name="docker-test",
-            description="Test Docker generation",
-            language="python",
-            project_type="cli",
-            features=["testing", "docker"]
-        )
-        
-        scaffolder = ProjectScaffolder(Path(tmpdir))
-        files = scaffolder.scaffold(spec)
-        
-        file_paths = [f.path for f in files]
-        assert 'Dockerfile' in file_paths
-        assert 'docker-compose.yml' in file_paths
+    files, _ = scaffolded_cli_project("docker-test", ("testing", "docker"))
+    
+    file_paths = [f.path for f in files]
+    assert 'Dockerfile' in file_paths
+    assert 'docker-compose.yml' in file_paths
+
+
+def test_compiled_templates_match_format_map():
+    """Test precompiled templates render exactly like str.format_map."""
+    vars = {
+        'name': 'my-tool', 'name_lower': 'my_tool', 'class_name': 'MyTool',
+        'description': 'A {braced} tool', 'dependencies': '"requests"',
+    }
+    templates = [ProjectScaffolder.CONFIG_TEMPLATES, ProjectScaffolder.CI_TEMPLATES,
+                 ProjectScaffolder.DOCKER_TEMPLATES]
+    templates.extend(ProjectScaffolder.PYTHON_TEMPLATES.values())
+    
+    for group in templates:
+        for template in group.values():
+            assert _compile_template(template)(vars) == template.format_map(vars)
 
 
 # ========== Test Runner Tests ==========
@@ -169,56 +226,47 @@ def test_test_result_dataclass():
     assert result.details == {}
 
 
-def test_test_runner_detect_framework_pytest():
+def test_test_runner_detect_framework_pytest(tmp_path):
     """Test detection of pytest framework."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Create pytest.ini
-        (tmppath / "pytest.ini").write_text("[pytest]\n")
-        
-        runner = TestRunner(tmppath)
-        framework = runner.detect_test_framework()
-        
-        assert framework == "pytest"
+    # Create pytest.ini
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    
+    runner = TestRunner(tmp_path)
+    framework = runner.detect_test_framework()
+    
+    assert framework == "pytest"
 
 
-def test_test_runner_detect_framework_from_pyproject():
+def test_test_runner_detect_framework_from_pyproject(tmp_path):
     """Test detection from pyproject.toml."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Create pyproject.toml with pytest config
-        (tmppath / "pyproject.toml").write_text("""
+    # Create pyproject.toml with pytest config
+    (tmp_path / "pyproject.toml").write_text("""
 [tool.pytest.ini_options]
 testpaths = ["tests"]
 """)
-        
-        runner = TestRunner(tmppath)
-        framework = runner.detect_test_framework()
-        
-        assert framework == "pytest"
+    
+    runner = TestRunner(tmp_path)
+    framework = runner.detect_test_framework()
+    
+    assert framework == "pytest"
 
 
-def test_test_runner_run_tests_no_tests():
+def test_test_runner_run_tests_no_tests(tmp_path):
     """Test runner handles missing tests gracefully."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        runner = TestRunner(Path(tmpdir))
-        result = runner.run_tests()
-        
-        # Should return skipped or error status
-        assert result.status in [TestStatus.SKIPPED, TestStatus.ERROR, TestStatus.FAILED]
+    runner = TestRunner(tmp_path)
+    result = runner.run_tests()
+    
+    # Should return skipped or error status
+    assert result.status in [TestStatus.SKIPPED, TestStatus.ERROR, TestStatus.FAILED]
 
 
-def test_test_runner_run_python_tests():
+def test_test_runner_run_python_tests(tmp_path):
     """Test runner can run simple Python tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        tests_dir = tmppath / "tests"
-        tests_dir.mkdir()
-        
-        # Create a simple passing test
-        (tests_dir / "test_simple.py").write_text("""
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    
+    # Create a simple passing test
+    (tests_dir / "test_simple.py").write_text("""
 def test_passing():
     assert True
 
@@ -226,41 +274,120 @@ if __name__ == "__main__":
     test_passing()
     print("All tests passed!")
 """)
-        
-        runner = TestRunner(tmppath)
-        result = runner._run_python_tests(None)
-        
-        assert result.status == TestStatus.PASSED
+    
+    runner = TestRunner(tmp_path)
+    result = runner._run_python_tests(None)
+    
+    assert result.status == TestStatus.PASSED
+    assert "All tests passed!" in result.output
+
+
+def test_test_runner_run_python_tests_in_process(tmp_path):
+    """Test the direct-run path with an in-process runner, passing and failing."""
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    
+    (tests_dir / "test_simple.py").write_text("""
+def test_passing():
+    assert True
+
+if __name__ == "__main__":
+    test_passing()
+    print("All tests passed!")
+""")
+    
+    runner = TestRunner(tmp_path)
+    result = runner._run_python_tests(None, runner=_runpy_runner)
+    
+    assert result.status == TestStatus.PASSED
+    assert "All tests passed!" in result.output
+    
+    (tests_dir / "test_failing.py").write_text("assert False, 'boom'\n")
+    result = runner._run_python_tests(None, runner=_runpy_runner)
+    
+    assert result.status == TestStatus.FAILED
+    assert "boom" in result.error
+
+
+def test_test_runner_in_process_isolates_projects(tmp_path):
+    """Test in-process runs of two projects with the same module names stay separate."""
+    if pytest is None:
+        return
+    for name in ("alpha", "beta"):
+        scaffolder = ProjectScaffolder(tmp_path / name)
+        scaffolder.write_files(scaffolder.scaffold(ProjectSpec(
+            name=name, description=f"{name} project", language="python",
+            project_type="cli", features=["testing"]
+        )))
+    (tmp_path / "beta" / "beta_marker.txt").write_text("beta")
+    (tmp_path / "beta" / "tests" / "test_extra.py").write_text("""
+from pathlib import Path
+
+
+def test_runs_from_project_root():
+    assert Path("beta_marker.txt").read_text() == "beta"
+
+
+def test_fails():
+    assert False
+""")
+    
+    saved_modules = set(sys.modules)
+    saved_path = list(sys.path)
+    saved_cwd = os.getcwd()
+    
+    alpha = TestRunner(tmp_path / "alpha").run_tests(in_process=True)
+    beta = TestRunner(tmp_path / "beta").run_tests(in_process=True)
+    
+    assert alpha.status == TestStatus.PASSED
+    assert alpha.details == {'passed': 2, 'failed': 0, 'skipped': 0, 'errors': 0}
+    assert "test_alpha_run" in alpha.output and "test_beta" not in alpha.output
+    
+    assert beta.status == TestStatus.FAILED
+    assert beta.details == {'passed': 3, 'failed': 1, 'skipped': 0, 'errors': 0}
+    assert "test_beta_run" in beta.output and "test_alpha" not in beta.output
+    assert "test_fails" in beta.error
+    
+    assert set(sys.modules) == saved_modules
+    assert sys.path == saved_path
+    assert os.getcwd() == saved_cwd
 
 
 # ========== Debug Loop Tests ==========
 
-def test_debug_loop_initialization():
+def test_debug_loop_initialization(tmp_path):
     """Test DebugLoop can be initialized."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        loop = DebugLoop(Path(tmpdir))
-        
-        assert loop.project_dir == Path(tmpdir)
-        assert loop.max_iterations == 5
+    loop = DebugLoop(tmp_path)
+    
+    assert loop.project_dir == tmp_path
+    assert loop.max_iterations == 5
 
 
-def test_debug_loop_pattern_analysis():
+def test_debug_loop_pattern_analysis(tmp_path):
     """Test pattern-based error analysis."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        loop = DebugLoop(Path(tmpdir))
-        
-        result = TestResult(
-            name="test",
-            status=TestStatus.FAILED,
-            output="",
-            error="ImportError: No module named 'missing_module'"
-        )
-        
-        suggestions = loop.analyze_failure(result)
-        
-        # Should find the import error
-        assert len(suggestions) > 0
-        assert any("ImportError" in s.explanation for s in suggestions)
+    loop = DebugLoop(tmp_path)
+    
+    result = TestResult(
+        name="test",
+        status=TestStatus.FAILED,
+        output="",
+        error="ImportError: No module named 'missing_module'"
+    )
+    
+    suggestions = loop.analyze_failure(result)
+    
+    # Should find the import error
+    assert len(suggestions) > 0
+    assert any("ImportError" in s.explanation for s in suggestions)
+
+
+def test_debug_loop_pattern_analysis_overlapping_errors(tmp_path):
+    """Test two error types on one line are both reported."""
+    loop = DebugLoop(tmp_path)
+    
+    suggestions = loop._pattern_analysis("SyntaxError: bad AssertionError")
+    
+    assert {s.explanation.split(":")[0] for s in suggestions} == {"SyntaxError", "AssertionError"}
 
 
 # ========== Verification Tests ==========
@@ -273,35 +400,30 @@ def test_verify_project_nonexistent():
     assert len(result['issues']) > 0
 
 
-def test_verify_project_empty():
+def test_verify_project_empty(tmp_path):
     """Test verification of empty project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        result = verify_project(Path(tmpdir))
-        
-        assert result['exists'] is True
-        assert result['has_tests'] is False
-        assert result['has_readme'] is False
+    result = verify_project(tmp_path)
+    
+    assert result['exists'] is True
+    assert result['has_tests'] is False
+    assert result['has_readme'] is False
 
 
-def test_verify_project_with_readme():
+def test_verify_project_with_readme(tmp_path):
     """Test verification detects README."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        (tmppath / "README.md").write_text("# Test Project")
-        
-        result = verify_project(tmppath)
-        
-        assert result['has_readme'] is True
+    (tmp_path / "README.md").write_text("# Test Project")
+    
+    result = verify_project(tmp_path)
+    
+    assert result['has_readme'] is True
 
 
-def test_verify_project_with_tests():
+def test_verify_project_with_tests(tmp_path):
     """Test verification detects and runs tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        tests_dir = tmppath / "tests"
-        tests_dir.mkdir()
-        
-        (tests_dir / "test_basic.py").write_text("""
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    
+    (tests_dir / "test_basic.py").write_text("""
 def test_pass():
     assert True
 
@@ -309,10 +431,25 @@ if __name__ == "__main__":
     test_pass()
     print("All tests passed!")
 """)
-        
-        result = verify_project(tmppath)
-        
-        assert result['has_tests'] is True
+    
+    result = verify_project(tmp_path)
+    
+    assert result['has_tests'] is True
+    assert result['tests_pass'] is True
+
+
+def test_verify_project_reuses_test_result(tmp_path):
+    """Test verification reports a given test result instead of rerunning the suite."""
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_basic.py").write_text("def test_pass():\n    assert True\n")
+    
+    earlier = TestResult(name="pytest", status=TestStatus.FAILED, output="1 failed", error="boom")
+    result = verify_project(tmp_path, test_result=earlier)
+    
+    assert result['tests_pass'] is False
+    assert result['test_details'] == {'status': 'failed', 'output': '1 failed'}
+    assert 'Tests failed: boom' in result['issues']
 
 
 # ========== Pipeline Tests ==========
@@ -330,6 +467,22 @@ def test_pipeline_state_creation():
     assert state.started_at is not None
 
 
+def test_pipeline_to_json_uses_stdlib_format(tmp_path):
+    """Test to_json output matches json.dumps, including escapes and int keys."""
+    pipeline = ProjectPipeline(output_dir=tmp_path, interactive=False)
+    pipeline.state = PipelineState(
+        stage=PipelineStage.COMPLETE,
+        project_name="café",
+        test_results={1: "ok"}
+    )
+    
+    output = pipeline.to_json()
+    
+    assert "caf\\u00e9" in output
+    assert json.loads(output)["test_results"] == {"1": "ok"}
+    assert json.loads(output)["stage"] == "complete"
+
+
 def test_pipeline_stage_enum():
     """Test PipelineStage values."""
     assert PipelineStage.INPUT.value == "input"
@@ -337,131 +490,149 @@ def test_pipeline_stage_enum():
     assert PipelineStage.FAILED.value == "failed"
 
 
-def test_vibecoder_pipeline_initialization():
+def test_vibecoder_pipeline_initialization(tmp_path):
     """Test VibeCoderPipeline initialization."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = VibeCoderPipeline(output_dir=tmpdir)
-        
-        assert pipeline.output_dir == Path(tmpdir)
-        assert pipeline.history == []
+    pipeline = VibeCoderPipeline(output_dir=str(tmp_path))
+    
+    assert pipeline.output_dir == tmp_path
+    assert pipeline.history == []
 
 
-def test_vibecoder_pipeline_list_empty():
+def test_vibecoder_pipeline_list_empty(tmp_path):
     """Test listing projects when none exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = VibeCoderPipeline(output_dir=tmpdir)
-        projects = pipeline.list_projects()
-        
-        assert projects == []
+    pipeline = VibeCoderPipeline(output_dir=str(tmp_path))
+    projects = pipeline.list_projects()
+    
+    assert projects == []
 
 
-def test_vibecoder_pipeline_create_project():
+@slow
+def test_vibecoder_pipeline_create_project(created_project):
     """Test full project creation through pipeline."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = VibeCoderPipeline(output_dir=tmpdir)
-        result = pipeline.create(
-            "Create a simple Python CLI tool",
-            interactive=False
-        )
-        
-        assert 'success' in result
-        assert 'project_name' in result
-        assert 'project_dir' in result
-        assert result['files_generated'] > 0
+    _, result = created_project
+    
+    assert 'success' in result
+    assert 'project_name' in result
+    assert 'project_dir' in result
+    assert result['files_generated'] > 0
 
 
-def test_vibecoder_pipeline_project_status():
-    """Test getting status of generated project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = VibeCoderPipeline(output_dir=tmpdir)
-        
-        # Create a project first
-        result = pipeline.create(
-            "Create a test project",
-            interactive=False
-        )
-        
-        # Get its status
-        status = pipeline.get_project_status(result['project_name'])
-        
-        assert 'exists' in status
-        assert status['exists'] is True
+def test_vibecoder_pipeline_project_status(tmp_path):
+    """Test getting status of an existing project directory."""
+    (tmp_path / "dummy").mkdir()
+    pipeline = VibeCoderPipeline(output_dir=str(tmp_path))
+    
+    status = pipeline.get_project_status("dummy")
+    
+    assert 'exists' in status
+    assert status['exists'] is True
+
+
+def test_vibecoder_pipeline_project_status_cached_until_changed(tmp_path):
+    """Test status reports are reused until the project tree changes."""
+    (tmp_path / "dummy").mkdir()
+    pipeline = VibeCoderPipeline(output_dir=str(tmp_path))
+    
+    first = pipeline.get_project_status("dummy")
+    assert pipeline.get_project_status("dummy") == first
+    assert first['has_readme'] is False
+    
+    # Callers get their own copy; mutating it leaves the cache intact
+    first['issues'].append('caller note')
+    assert 'caller note' not in pipeline.get_project_status("dummy")['issues']
+    
+    (tmp_path / "dummy" / "README.md").write_text("# Dummy")
+    
+    assert pipeline.get_project_status("dummy")['has_readme'] is True
 
 
-def test_project_pipeline_generates_working_project():
+def test_vibecoder_pipeline_project_status_sees_in_place_edit(tmp_path):
+    """Test an edit that keeps entry count and mtime still refreshes status."""
+    tests_dir = tmp_path / "dummy" / "tests"
+    tests_dir.mkdir(parents=True)
+    test_file = tests_dir / "test_dummy.py"
+    test_file.write_text("def test_ok():\n    assert True\n")
+    pipeline = VibeCoderPipeline(output_dir=str(tmp_path))
+    
+    assert pipeline.get_project_status("dummy")['tests_pass'] is True
+    
+    mtime_ns = test_file.stat().st_mtime_ns
+    test_file.write_text("def test_ok():\n    assert 1 == 2\n")
+    os.utime(test_file, ns=(mtime_ns, mtime_ns))
+    
+    assert pipeline.get_project_status("dummy")['tests_pass'] is False
+
+
+@slow
+def test_vibecoder_pipeline_project_status_after_create(created_project):
+    """Test getting status of a project generated by create()."""
+    pipeline, result = created_project
+    
+    # Get status of the shared project
+    status = pipeline.get_project_status(result['project_name'])
+    
+    assert 'exists' in status
+    assert status['exists'] is True
+
+
+@slow
+def test_project_pipeline_generates_working_project(tmp_path):
     """Test that generated project has runnable tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = ProjectPipeline(
-            output_dir=Path(tmpdir),
-            interactive=False
-        )
-        
-        state = pipeline.generate_project("Create a Python library for utilities")
-        
-        # Project should be created
-        assert state.project_dir is not None
-        assert Path(state.project_dir).exists()
-        
-        # Should have generated files
-        assert len(state.generated_files) > 0
+    pipeline = ProjectPipeline(
+        output_dir=tmp_path,
+        interactive=False
+    )
+    
+    state = pipeline.generate_project("Create a Python library for utilities")
+    
+    # Project should be created
+    assert state.project_dir is not None
+    assert Path(state.project_dir).exists()
+    
+    # Should have generated files
+    assert len(state.generated_files) > 0
 
 
 # ========== Integration Tests ==========
 
-def test_end_to_end_project_generation():
+@slow
+def test_end_to_end_project_generation(scaffolded_cli_project, tmp_path):
     """Test complete end-to-end project generation."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Parse input
-        spec = parse_project_input("Create a Python CLI tool called myutil")
-        
-        # Scaffold project
-        project_dir = Path(tmpdir) / spec.name
-        project_dir.mkdir(parents=True)
-        
-        scaffolder = ProjectScaffolder(project_dir)
-        files = scaffolder.scaffold(spec)
-        scaffolder.write_files(files)
-        
-        # Verify project
-        verification = verify_project(project_dir)
-        
-        assert verification['exists'] is True
-        assert verification['has_readme'] is True
-        assert verification['has_config'] is True
-        assert verification['has_tests'] is True
+    # Parse input
+    spec = parse_project_input("Create a Python CLI tool called myutil")
+    
+    # Scaffold project; verification runs its tests, so work on a copy
+    _, scaffolded_dir = scaffolded_cli_project(
+        spec.name, spec.features, spec.language, spec.project_type
+    )
+    project_dir = tmp_path / spec.name
+    shutil.copytree(scaffolded_dir, project_dir)
+    
+    # Verify project
+    verification = verify_project(project_dir)
+    
+    assert verification['exists'] is True
+    assert verification['has_readme'] is True
+    assert verification['has_config'] is True
+    assert verification['has_tests'] is True
 
 
-def test_generated_project_structure():
+@slow
+def test_generated_project_structure(scaffolded_cli_project):
     """Test that generated project has correct structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec = ProjectSpec(
-            name="struct-test",
-            description="Structure test",
-            language="python",
-            project_type="cli",
-            features=["testing", "ci", "docker"]
-        )
-        
-        project_dir = Path(tmpdir)
-        scaffolder = ProjectScaffolder(project_dir)
-        files = scaffolder.scaffold(spec)
-        scaffolder.write_files(files)
-        
-        # Check structure
-        assert (project_dir / "main.py").exists()
-        assert (project_dir / "README.md").exists()
-        assert (project_dir / "pyproject.toml").exists()
-        assert (project_dir / "Makefile").exists()
-        assert (project_dir / ".gitignore").exists()
-        assert (project_dir / "tests").exists()
-        assert (project_dir / "src").exists()
-        assert (project_dir / ".github" / "workflows" / "ci.yml").exists()
-        assert (project_dir / "Dockerfile").exists()
+    _, project_dir = scaffolded_cli_project("struct-test", ("testing", "ci", "docker"))
+    
+    # Enumerate the tree once and check structure in memory
+    present = {p.relative_to(project_dir).as_posix() for p in project_dir.rglob("*")}
+    for expected in ("main.py", "README.md", "pyproject.toml", "Makefile",
+                     ".gitignore", "tests", "src",
+                     ".github/workflows/ci.yml", "Dockerfile"):
+        assert expected in present, expected
 
 
 if __name__ == "__main__":
     # Simple test runner
-    import traceback
+    from _helpers import _run_parallel
     
     test_functions = [
         # Scaffolder tests
@@ -470,10 +641,15 @@ if __name__ == "__main__":
         test_parse_project_input_api,
         test_parse_project_input_with_ci,
         test_parse_project_input_with_docker,
+        test_parse_project_input_matches_whole_words,
+        test_parse_project_input_matches_inflections,
+        test_parse_project_input_returns_independent_copies,
         test_scaffolder_creates_files,
         test_scaffolder_writes_files,
+        test_scaffolder_writes_files_in_parallel,
         test_scaffolder_with_ci,
         test_scaffolder_with_docker,
+        test_compiled_templates_match_format_map,
         
         # Test runner tests
         test_test_result_dataclass,
@@ -481,24 +657,32 @@ if __name__ == "__main__":
         test_test_runner_detect_framework_from_pyproject,
         test_test_runner_run_tests_no_tests,
         test_test_runner_run_python_tests,
+        test_test_runner_run_python_tests_in_process,
+        test_test_runner_in_process_isolates_projects,
         
         # Debug loop tests
         test_debug_loop_initialization,
         test_debug_loop_pattern_analysis,
+        test_debug_loop_pattern_analysis_overlapping_errors,
         
         # Verification tests
         test_verify_project_nonexistent,
         test_verify_project_empty,
         test_verify_project_with_readme,
         test_verify_project_with_tests,
+        test_verify_project_reuses_test_result,
         
         # Pipeline tests
         test_pipeline_state_creation,
+        test_pipeline_to_json_uses_stdlib_format,
         test_pipeline_stage_enum,
         test_vibecoder_pipeline_initialization,
         test_vibecoder_pipeline_list_empty,
         test_vibecoder_pipeline_create_project,
         test_vibecoder_pipeline_project_status,
+        test_vibecoder_pipeline_project_status_cached_until_changed,
+        test_vibecoder_pipeline_project_status_sees_in_place_edit,
+        test_vibecoder_pipeline_project_status_after_create,
         test_project_pipeline_generates_working_project,
         
         # Integration tests
@@ -506,18 +690,4 @@ if __name__ == "__main__":
         test_generated_project_structure,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test_func in test_functions:
-        try:
-            test_func()
-            print(f"✓ {test_func.__name__}")
-            passed += 1
-        except Exception as e:
-            print(f"✗ {test_func.__name__}")
-            traceback.print_exc()
-            failed += 1
-    
-    print(f"\n{passed} passed, {failed} failed")
-    sys.exit(0 if failed == 0 else 1)
+    sys.exit(_run_parallel(test_functions))
@@ -2,6 +2,8 @@
 Tests for VibeCoder-Zero autonomous coding entity.
 """
 
+import contextlib
+import io
 import os
 import sys
 import tempfile
@@ -11,7 +13,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from vibecoder.runtime.cli import VibeCoder
+from vibecoder.runtime.cli import VibeCoder, REQUIRED_API_KEYS
 from vibecoder.core.analyzer import CodebaseAnalyzer, EnvironmentState
 from vibecoder.core.planner import SelfImprovementPlanner
 from vibecoder.core.output import DirectiveOutput
@@ -103,6 +105,29 @@ def test_api_key_demand():
                 os.environ[key] = value
 
 
+def test_api_key_demand_cache_invalidation():
+    """Test the API key check is cached until explicitly invalidated."""
+    saved_keys = {key: os.environ.pop(key, None) for key in REQUIRED_API_KEYS}
+    
+    try:
+        vibecoder = VibeCoder()
+        first = vibecoder.demand_api_keys()
+        assert first is not None
+        
+        for key in REQUIRED_API_KEYS:
+            os.environ[key] = "test-value"
+        assert vibecoder.demand_api_keys() is first
+        
+        vibecoder.invalidate_api_key_cache()
+        assert vibecoder.demand_api_keys() is None
+    finally:
+        for key, value in saved_keys.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
 def test_directive_output_creation():
     """Test DirectiveOutput dataclass."""
     directive = DirectiveOutput(
@@ -116,7 +141,7 @@ def test_directive_output_creation():
     assert directive.content == "echo 'test'"
     assert directive.description == "Test directive"
     assert directive.priority == 1
-    assert directive.requires_api_keys == []
+    assert directive.requires_api_keys == ()
 
 
 def test_language_detection():
@@ -139,6 +164,92 @@ def test_language_detection():
         assert 'CSS' in analyzer.languages
 
 
+def test_analyzer_skips_ignored_dirs():
+    """Test the scan does not count files inside ignored directories."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        (tmppath / "main.py").write_text("print('hello')")
+        (tmppath / "node_modules" / "pkg").mkdir(parents=True)
+        (tmppath / "node_modules" / "pkg" / "index.js").write_text("module.exports = {}")
+        
+        analyzer = CodebaseAnalyzer(tmppath)
+        results = analyzer.analyze()
+        
+        assert results['file_count'] == 1
+        assert results['dir_count'] == 0
+        assert results['languages'] == {'Python': 1}
+
+
+def test_analyzer_ignores_dangling_symlinks():
+    """Test dangling indicator symlinks count as missing instead of crashing."""
+    if not hasattr(os, "symlink"):
+        return
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / "main.py").write_text("print('hello')")
+        try:
+            os.symlink("nonexistent", tmppath / "Dockerfile")
+            os.symlink("nonexistent.md", tmppath / "README.md")
+        except OSError:  # Symlinks not permitted (e.g. Windows without privileges)
+            return
+        
+        results = CodebaseAnalyzer(tmppath).analyze()
+        
+        assert 'Docker' not in results['frameworks']
+        vector_types = [v['type'] for v in results['optimization_vectors']]
+        assert 'documentation' in vector_types
+
+
+def test_analyzer_fast_mode_stops_early():
+    """Test fast analysis stops counting past the largest threshold."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for i in range(15):
+            (tmppath / f"file{i}.py").touch()
+        
+        results = CodebaseAnalyzer(tmppath).analyze(fast=True)
+        
+        assert results['file_count'] == 11
+        vector_types = [v['type'] for v in results['optimization_vectors']]
+        assert 'testing' in vector_types
+        assert 'ci_cd' in vector_types
+
+
+def test_analyzer_fast_mode_matches_full_vectors():
+    """Test fast analysis keeps walking until it knows whether Python is used."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / "a").mkdir()
+        (tmppath / "z").mkdir()
+        for i in range(12):
+            (tmppath / "a" / f"notes{i}.txt").touch()
+        (tmppath / "z" / "m.py").touch()
+        
+        fast = CodebaseAnalyzer(tmppath).analyze(fast=True)
+        full = CodebaseAnalyzer(tmppath).analyze()
+        
+        assert fast['optimization_vectors'] == full['optimization_vectors']
+        vector_types = [v['type'] for v in fast['optimization_vectors']]
+        assert 'dependency_management' in vector_types
+
+
+def test_analyzer_parallel_walk_matches_serial():
+    """Test wide trees walked on the thread pool give exact counts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for i in range(120):
+            pkg = tmppath / f"pkg{i}" / "sub"
+            pkg.mkdir(parents=True)
+            (pkg / "mod.py").touch()
+        
+        results = CodebaseAnalyzer(tmppath).analyze()
+        
+        assert results['file_count'] == 120
+        assert results['dir_count'] == 240
+        assert results['languages'] == {'Python': 120}
+
+
 def test_framework_detection():
     """Test framework detection."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -273,6 +384,36 @@ def test_vibe_log_updates_on_populated_environment():
         assert "State: POPULATED" in content or "populated" in content.lower()
 
 
+def test_execute_json_output_skips_report():
+    """Test execute(output_format="json") returns directives without printing the report."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            directives = VibeCoder(work_dir=tmpdir).execute(output_format="json")
+        assert directives
+        assert stdout.getvalue() == ""
+        
+        with contextlib.redirect_stdout(stdout):
+            VibeCoder(work_dir=tmpdir).execute(output_format="both")
+        assert "DIRECTIVES (Execute in order)" in stdout.getvalue()
+
+
+def test_execute_json_output_keeps_auto_exec_off_stdout():
+    """Test auto-execution in JSON mode reports on stderr, leaving stdout empty."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        original_cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                VibeCoder(work_dir=tmpdir, auto_execute=True).execute(output_format="json")
+        finally:
+            os.chdir(original_cwd)
+        
+        assert stdout.getvalue() == ""
+        assert "[AUTO-EXEC]" in stderr.getvalue()
+
+
 if __name__ == "__main__":
     # Simple test runner if pytest is not available
     import traceback
@@ -284,8 +425,14 @@ if __name__ == "__main__":
         test_codebase_analyzer,
         test_self_improvement_planner,
         test_api_key_demand,
+        test_api_key_demand_cache_invalidation,
         test_directive_output_creation,
         test_language_detection,
+        test_analyzer_skips_ignored_dirs,
+        test_analyzer_ignores_dangling_symlinks,
+        test_analyzer_fast_mode_stops_early,
+        test_analyzer_fast_mode_matches_full_vectors,
+        test_analyzer_parallel_walk_matches_serial,
         test_framework_detection,
         test_optimization_vector_identification,
         test_full_execution_empty_dir,
@@ -294,6 +441,8 @@ if __name__ == "__main__":
         test_vibe_log_persistence,
         test_vibe_log_tracks_goals,
         test_vibe_log_updates_on_populated_environment,
+        test_execute_json_output_skips_report,
+        test_execute_json_output_keeps_auto_exec_off_stdout,
     ]
     
     passed = 0
@@ -1,16 +1,20 @@
 """Codebase analysis functionality."""
 
+import os
+import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 from enum import Enum
 
 
 # Constants for directory scanning and analysis
-IGNORE_DIRS = {
+IGNORE_DIRS = frozenset({
     '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'dist', 'build',
     '.mypy_cache', '.pytest_cache', '.coverage', 'htmlcov', '.tox', '.eggs',
     '.cache', '.ruff_cache', 'coverage', '.hypothesis'
-}
+})
 
 LANGUAGE_EXTENSIONS = {
     '.py': 'Python',
@@ -51,23 +55,48 @@ FRAMEWORK_INDICATORS = {
     '.github/workflows': ['GitHub Actions'],
 }
 
+# Largest file_count threshold _identify_optimization_vectors compares against;
+# analyze(fast=True) stops walking once the count exceeds it and a Python file
+# (which the dependency_management vector depends on) has been seen
+FAST_SCAN_FILE_LIMIT = 10
+
+# Once this many directories are waiting to be listed, the walk switches to a
+# thread pool; smaller trees stay serial since pool overhead would dominate
+PARALLEL_WALK_MIN_DIRS = 100
+
 TEST_DIRS = ['tests', 'test', '__tests__', 'spec']
 
 CI_FILES = ['.github/workflows', '.gitlab-ci.yml', '.travis.yml', 'Jenkinsfile']
 
-EMPTINESS_IGNORED_FILES = {'.git', '.gitignore', 'readme.md', 'readme.txt', 'readme'}
+# Lowercase names, compared against entry.name.lower()
+EMPTINESS_IGNORED_FILES = frozenset({'.git', '.gitignore', 'readme.md', 'readme.txt', 'readme'})
+
+# Plain string forms of EnvironmentState for result dicts, so hot paths skip
+# the enum member + ``.value`` descriptor lookups
+STATE_EMPTY = sys.intern("empty")
+STATE_POPULATED = sys.intern("populated")
+STATE_INITIALIZED = sys.intern("initialized")
 
 
 class EnvironmentState(Enum):
     """Represents the current state of the working environment."""
-    EMPTY = "empty"
-    POPULATED = "populated"
-    INITIALIZED = "initialized"
+    EMPTY = STATE_EMPTY
+    POPULATED = STATE_POPULATED
+    INITIALIZED = STATE_INITIALIZED
+
+
+# EnvironmentState -> its string value, without going through ``.value``
+STATE_VALUES = {state: state.value for state in EnvironmentState}
 
 
 class CodebaseAnalyzer:
     """Analyzes existing codebases to identify optimization vectors."""
     
+    __slots__ = (
+        'root_path', 'file_count', 'dir_count', 'languages', 'frameworks',
+        'optimization_vectors', '_scanned', '_root_entries', '_resolved_root'
+    )
+    
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.file_count = 0
@@ -75,16 +104,62 @@ class CodebaseAnalyzer:
         self.languages = {}
         self.frameworks = []
         self.optimization_vectors = []
+        self._scanned = False
+        self._root_entries = None  # name -> os.DirEntry for the root, filled by the walk
+        self._resolved_root = None  # realpath of root_path, resolved on first symlink
     
-    def analyze(self) -> Dict:
-        """Perform comprehensive codebase analysis."""
+    def analyze(self, fast: bool = False) -> Dict:
+        """Perform comprehensive codebase analysis.
+        
+        Args:
+            fast: Stop walking once more than FAST_SCAN_FILE_LIMIT files and
+                at least one Python file are seen. Optimization vectors match
+                a full scan, but file/dir counts and languages only cover the
+                part of the tree walked.
+        """
+        if fast:
+            return self._analyze_fast()
+        
+        # One walk feeds the counts, the languages and the root-level
+        # entries used by framework detection
         self._scan_directory()
-        self._detect_languages()
         self._detect_frameworks()
         self._identify_optimization_vectors()
         
+        return self._results()
+    
+    def _analyze_fast(self) -> Dict:
+        """Analyze with a walk that stops once the vectors are settled.
+        
+        The file-count vectors are settled past FAST_SCAN_FILE_LIMIT files;
+        the dependency_management vector also needs to know whether any
+        Python file exists, so the walk continues until one is seen.
+        """
+        entries = []
+        files = 0
+        seen_python = False
+        splitext = os.path.splitext
+        for entry in self._scandir_recursive(str(self.root_path)):
+            entries.append(entry)
+            if entry.is_file():
+                files += 1
+                if not seen_python:
+                    seen_python = LANGUAGE_EXTENSIONS.get(splitext(entry.name)[1]) == 'Python'
+                if files > FAST_SCAN_FILE_LIMIT and seen_python:
+                    break
+        self._scan_directory(entries)
+        
+        # The walk may stop inside the root listing, so list the root fully
+        self._root_entries = None
+        self._ensure_root_entries()
+        self._detect_frameworks()
+        self._identify_optimization_vectors()
+        return self._results()
+    
+    def _results(self) -> Dict:
+        """Assemble the analysis result dict from the current attributes."""
         return {
-            "state": EnvironmentState.POPULATED.value,
+            "state": STATE_POPULATED,
             "file_count": self.file_count,
             "dir_count": self.dir_count,
             "languages": self.languages,
@@ -92,56 +167,202 @@ class CodebaseAnalyzer:
             "optimization_vectors": self.optimization_vectors
         }
     
-    def _scan_directory(self):
-        """Scan directory structure."""
-        resolved_root = self.root_path.resolve()
-        for item in self.root_path.rglob('*'):
-            if any(ignored in item.parts for ignored in IGNORE_DIRS):
-                continue
-            
-            # Prevent directory traversal via symlinks
-            try:
-                if not item.resolve().is_relative_to(resolved_root):
-                    continue
-            except (ValueError, OSError):
-                continue
-            
-            if item.is_file():
-                self.file_count += 1
-            elif item.is_dir():
+    def _scandir_recursive(self, path: str, root_entries: Optional[Dict[str, os.DirEntry]] = None):
+        """Yield every ``os.DirEntry`` under ``path``.
+        
+        If ``root_entries`` is given, the entries directly under ``path`` are
+        also recorded in it by name.
+        
+        Entries named in IGNORE_DIRS are pruned with a single set lookup
+        before they are opened. Symlinks are yielded only if their target
+        resolves inside the root, and are never descended into, so the walk
+        cannot escape the root. Unreadable directories are skipped.
+        
+        Uses an explicit stack rather than nested generators, so each entry
+        is yielded once instead of being re-yielded through every level of
+        ``yield from``. Wide trees (PARALLEL_WALK_MIN_DIRS directories
+        pending) continue on a thread pool; entry order is then unspecified.
+        """
+        entries, pending = self._list_directory(path)
+        if root_entries is not None:
+            for entry in entries:
+                root_entries[entry.name] = entry
+        yield from entries
+        
+        while pending:
+            if len(pending) >= PARALLEL_WALK_MIN_DIRS:
+                yield from self._scandir_parallel(pending)
+                return
+            entries, subdirs = self._list_directory(pending.pop())
+            yield from entries
+            pending.extend(subdirs)
+    
+    def _scandir_parallel(self, pending: List[str]):
+        """Continue a walk by listing ``pending`` directories concurrently.
+        
+        scandir releases the GIL, so directory reads overlap; entries are
+        yielded from this thread as each listing completes.
+        """
+        pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+        futures = {pool.submit(self._list_directory, d) for d in pending}
+        try:
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entries, subdirs = future.result()
+                    yield from entries
+                    futures.update(pool.submit(self._list_directory, d) for d in subdirs)
+        finally:
+            # Stop queued listings if the consumer stops early (fast mode)
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=True)
+    
+    def _list_directory(self, path: str):
+        """List one directory for the walk.
+        
+        Returns:
+            Tuple of (entries to yield, subdirectory paths to descend into);
+            both empty if the directory cannot be read
+        """
+        entries = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name in IGNORE_DIRS:
+                        continue
+                    
+                    # Only symlinks pay for a realpath() containment check
+                    is_link = entry.is_symlink()
+                    if is_link and not self._symlink_inside_root(entry):
+                        continue
+                    
+                    entries.append(entry)
+                    if not is_link and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            pass
+        return entries, subdirs
+    
+    def _symlink_inside_root(self, entry: os.DirEntry) -> bool:
+        """Check that a symlink's target resolves inside the root.
+        
+        The root is resolved once per analyzer; plain string comparison via
+        ``os.path.commonpath`` avoids building Path objects.
+        """
+        if self._resolved_root is None:
+            self._resolved_root = os.path.realpath(os.fspath(self.root_path))
+        resolved_root = self._resolved_root
+        try:
+            return os.path.commonpath([resolved_root, os.path.realpath(entry.path)]) == resolved_root
+        except ValueError:  # Different drives on Windows
+            return False
+    
+    def _scan_directory(self, entries: Optional[List[os.DirEntry]] = None):
+        """Scan directory structure, counting entries and languages in one pass.
+        
+        Args:
+            entries: Entries from an earlier ``_scandir_recursive`` walk to
+                reuse instead of walking again (optional)
+        """
+        if entries is None:
+            self._root_entries = {}
+            entries = self._scandir_recursive(str(self.root_path), self._root_entries)
+        
+        file_names = []
+        for entry in entries:
+            # Follows in-root symlinks; free for everything else (cached d_type)
+            if entry.is_dir():
                 self.dir_count += 1
+            elif entry.is_file():
+                file_names.append(entry.name)
+        self.file_count += len(file_names)
+        
+        # Tally languages in C: map names to extensions to languages, drop misses
+        splitext = os.path.splitext
+        detected = Counter(filter(None, map(
+            LANGUAGE_EXTENSIONS.get, (splitext(name)[1] for name in file_names)
+        )))
+        for lang, count in detected.items():
+            self.languages[lang] = self.languages.get(lang, 0) + count
+        
+        self._scanned = True
     
     def _detect_languages(self):
-        """Detect programming languages in use."""
-        resolved_root = self.root_path.resolve()
-        for file_path in self.root_path.rglob('*'):
-            # Prevent directory traversal via symlinks
-            try:
-                if not file_path.resolve().is_relative_to(resolved_root):
-                    continue
-            except (ValueError, OSError):
-                continue
-            
-            if file_path.is_file():
-                ext = file_path.suffix
-                if ext in LANGUAGE_EXTENSIONS:
-                    lang = LANGUAGE_EXTENSIONS[ext]
-                    self.languages[lang] = self.languages.get(lang, 0) + 1
+        """Detect programming languages in use.
+        
+        Languages are collected by ``_scan_directory``; this only triggers
+        the walk if it has not run yet.
+        """
+        if not self._scanned:
+            self._scan_directory()
     
     def _detect_frameworks(self):
-        """Detect frameworks and tools in use."""
+        """Detect frameworks and tools in use.
+        
+        Indicators are looked up in the root entries collected by the walk
+        (or in a single root listing if no walk ran) instead of being probed
+        one path at a time.
+        """
+        root_entries = self._ensure_root_entries()
+        
         for indicator, frameworks in FRAMEWORK_INDICATORS.items():
-            path = self.root_path / indicator
+            top, _, rest = indicator.partition('/')
+            entry = root_entries.get(top)
+            if entry is None:
+                continue
+            
             # Check file exists and has content (not empty)
-            if path.exists() and (path.is_dir() or path.stat().st_size > 0):
+            if rest:
+                # Nested indicator (e.g. .github/workflows): probe only when its parent exists
+                path = os.path.join(entry.path, rest)
+                found = os.path.isdir(path) or (os.path.isfile(path) and os.path.getsize(path) > 0)
+            else:
+                try:
+                    found = entry.is_dir() or entry.stat().st_size > 0
+                except OSError:  # Dangling symlink
+                    found = False
+            if found:
                 self.frameworks.extend(frameworks)
     
+    def _ensure_root_entries(self) -> Dict[str, os.DirEntry]:
+        """Return the walk's root entries, listing only the root if no walk ran."""
+        if self._root_entries is None:
+            self._root_entries = {}
+            try:
+                with os.scandir(self.root_path) as it:
+                    for entry in it:
+                        if entry.name in IGNORE_DIRS:
+                            continue
+                        if entry.is_symlink() and not self._symlink_inside_root(entry):
+                            continue
+                        self._root_entries[entry.name] = entry
+            except OSError:
+                pass
+        return self._root_entries
+    
+    def _root_has(self, indicator: str) -> bool:
+        """Check whether a root-level name or nested path (``a/b``) exists.
+        
+        Root-level names are hash lookups; nested paths and symlinks (which
+        may dangle) cost one probe, and only when their top-level parent
+        exists.
+        """
+        top, _, rest = indicator.partition('/')
+        entry = self._ensure_root_entries().get(top)
+        if entry is None:
+            return False
+        if rest or entry.is_symlink():
+            return os.path.exists(os.path.join(self.root_path, indicator))
+        return True
+    
     def _identify_optimization_vectors(self):
         """Identify potential optimization opportunities."""
         vectors = []
         
         # Check for missing documentation
-        if not (self.root_path / 'README.md').exists():
+        if not self._root_has('README.md'):
             vectors.append({
                 "type": "documentation",
                 "priority": "high",
@@ -149,7 +370,7 @@ class CodebaseAnalyzer:
             })
         
         # Check for missing tests
-        has_tests = any((self.root_path / d).exists() for d in TEST_DIRS)
+        has_tests = any(self._root_has(d) for d in TEST_DIRS)
         if not has_tests and self.file_count > 5:
             vectors.append({
                 "type": "testing",
@@ -158,7 +379,7 @@ class CodebaseAnalyzer:
             })
         
         # Check for missing CI/CD
-        has_ci = any((self.root_path / f).exists() for f in CI_FILES)
+        has_ci = any(self._root_has(f) for f in CI_FILES)
         if not has_ci and self.file_count > 10:
             vectors.append({
                 "type": "ci_cd",
@@ -167,11 +388,9 @@ class CodebaseAnalyzer:
             })
         
         # Check for dependency management
-        if 'Python' in self.languages and not any([
-            (self.root_path / 'requirements.txt').exists(),
-            (self.root_path / 'Pipfile').exists(),
-            (self.root_path / 'pyproject.toml').exists()
-        ]):
+        if 'Python' in self.languages and not any(
+            self._root_has(name) for name in ('requirements.txt', 'Pipfile', 'pyproject.toml')
+        ):
             vectors.append({
                 "type": "dependency_management",
                 "priority": "high",
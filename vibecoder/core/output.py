@@ -1,18 +1,18 @@
 """Output dataclass for VibeCoder directives."""
 
+import sys
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
+# ``slots=`` needs Python 3.10+; older interpreters get a regular dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class DirectiveOutput:
     """Represents a directive to be executed by the biological IO interface."""
     directive_type: str  # 'command', 'code', 'file_operation'
     content: str
     description: str
     priority: int = 1
-    requires_api_keys: List[str] = None
-
-    def __post_init__(self):
-        if self.requires_api_keys is None:
-            self.requires_api_keys = []
+    requires_api_keys: Tuple[str, ...] = ()
@@ -5,9 +5,14 @@ creating complete, tested, and executable project structures.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+import os
+import re
+import string
 
 
 @dataclass
@@ -21,12 +26,97 @@ class ProjectSpec:
     dependencies: List[str] = field(default_factory=list)
 
 
-@dataclass 
+# Projects with at least this many files are written on a thread pool so the
+# open/write/close syscalls overlap; smaller ones stay serial
+PARALLEL_WRITE_MIN_FILES = 32
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write ``data`` to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _compile_template(template: str) -> Callable[[Mapping[str, str]], str]:
+    """Compile a ``str.format`` template once into a reusable renderer.
+    
+    The returned callable takes the template variables and produces the same
+    text as ``template.format_map(vars)`` for plain ``{field}`` placeholders.
+    The template is turned into Python source for a function that joins its
+    literal pieces and field lookups directly, so rendering runs no format
+    parsing or per-piece loop at all. Its ``has_shebang`` attribute records
+    whether the template text itself contains ``#!/``.
+    """
+    parts = []
+    literals = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+            literals.append(literal)
+        if field_name is not None:
+            parts.append(f"str(vars[{field_name!r}])")
+    
+    source = f"def render(vars):\n    return ''.join([{', '.join(parts)}])\n"
+    namespace = {}
+    exec(compile(source, '<scaffold template>', 'exec'), namespace)
+    render = namespace['render']
+    
+    render.has_shebang = any('#!/' in literal for literal in literals)
+    return render
+
+
+@functools.lru_cache(maxsize=256)
+def _name_forms(name: str) -> Tuple[str, str]:
+    """Derive ``(name_lower, class_name)`` from a project name, memoized per name."""
+    name_lower = name.lower().replace('-', '_').replace(' ', '_')
+    class_name = ''.join(word.capitalize() for word in name.replace('-', ' ').replace('_', ' ').split())
+    return name_lower, class_name
+
+
+# (path, renderer, executable) for each file a template group produces
+_CompiledFiles = Tuple[Tuple[str, Callable[[Mapping[str, str]], str], bool], ...]
+
+
+def _compile_files(templates: Dict[str, str], scripts: bool = False) -> _CompiledFiles:
+    """Compile a ``{path: template}`` group into ``(path, render, executable)`` triples.
+    
+    With ``scripts``, ``.py`` files whose template starts a shebang line are
+    marked executable; the flag is fixed here rather than searched for in
+    every rendered file.
+    """
+    compiled = []
+    for path, template in templates.items():
+        render = _compile_template(template)
+        compiled.append((path, render, scripts and path.endswith('.py') and render.has_shebang))
+    return tuple(compiled)
+
+
+def _compile_python_files(templates: Dict[str, Dict[str, str]]) -> Dict[str, _CompiledFiles]:
+    """Compile the per-project-type Python templates, each merged over ``cli``."""
+    return {
+        project_type: _compile_files({**templates['cli'], **overrides}, scripts=True)
+        for project_type, overrides in templates.items()
+    }
+
+
+@dataclass(frozen=True)
 class GeneratedFile:
     """Represents a file to be generated."""
     path: str
     content: str
     executable: bool = False
+    
+    @functools.cached_property
+    def encoded(self) -> bytes:
+        """UTF-8 bytes of ``content``, encoded on first use only.
+        
+        Rendered files are shared through the scaffold cache, so writing the
+        same project again reuses these bytes.
+        """
+        return self.content.encode('utf-8')
 
 
 class ProjectScaffolder:
@@ -387,6 +477,12 @@ services:
     restart: unless-stopped
 ''',
     }
+    
+    # The templates above, compiled once at import time
+    _PYTHON_FILES = _compile_python_files(PYTHON_TEMPLATES)
+    _CONFIG_FILES = _compile_files(CONFIG_TEMPLATES)
+    _CI_FILES = _compile_files(CI_TEMPLATES)
+    _DOCKER_FILES = _compile_files(DOCKER_TEMPLATES)
 
     def __init__(self, target_dir: Path):
         """Initialize scaffolder with target directory."""
@@ -399,28 +495,61 @@ services:
             spec: Project specification
             
         Returns:
-            List of generated files
+            List of generated files (a fresh list on every call)
+        """
+        # Feature order and duplicates do not affect the output, so normalize
+        # them out of the cache key
+        return list(self._render_files(
+            spec.name,
+            spec.description,
+            spec.language,
+            spec.project_type,
+            tuple(sorted(set(spec.features))),
+            tuple(spec.dependencies),
+        ))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _render_files(cls, name: str, description: str, language: str, project_type: str,
+                      features: tuple, dependencies: tuple) -> tuple:
+        """Render every file for a spec; cached, so the result is an immutable tuple.
+        
+        Name, description and dependencies are part of the key because they
+        are substituted into the templates.
         """
-        files = []
+        spec = ProjectSpec(
+            name=name,
+            description=description,
+            language=language,
+            project_type=project_type,
+            features=list(features),
+            dependencies=list(dependencies)
+        )
+        groups = []
         
         # Create template variables
-        template_vars = self._create_template_vars(spec)
+        template_vars = cls._create_template_vars(spec)
         
-        if spec.language == 'python':
-            files.extend(self._scaffold_python(spec, template_vars))
+        # Python sources: the project type's templates, or the CLI base
+        if language == 'python':
+            groups.append(cls._PYTHON_FILES.get(project_type, cls._PYTHON_FILES['cli']))
         
         # Add configuration files
-        files.extend(self._scaffold_config(spec, template_vars))
+        groups.append(cls._CONFIG_FILES)
         
         # Add CI/CD if requested
-        if 'ci' in spec.features:
-            files.extend(self._scaffold_ci(spec, template_vars))
+        if 'ci' in features:
+            groups.append(cls._CI_FILES)
         
         # Add Docker if requested
-        if 'docker' in spec.features:
-            files.extend(self._scaffold_docker(spec, template_vars))
+        if 'docker' in features:
+            groups.append(cls._DOCKER_FILES)
         
-        return files
+        return tuple([
+            GeneratedFile(path=path, content=render(template_vars), executable=executable)
+            for group in groups
+            for path, render, executable in group
+        ])
     
     def write_files(self, files: List[GeneratedFile]) -> List[Path]:
         """Write generated files to disk.
@@ -431,24 +560,43 @@ services:
         Returns:
             List of created file paths
         """
-        created = []
+        # Work on plain strings; Path objects are only built for the result
+        target = os.fspath(self.target_dir)
+        paths = [os.path.join(target, file.path) for file in files]
         
-        for file in files:
-            file_path = self.target_dir / file.path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(file.content)
-            
-            if file.executable:
-                file_path.chmod(0o755)
-            
-            created.append(file_path)
+        # Create each parent directory once, not once per file (shortest
+        # first, so parents exist before their children)
+        for parent in sorted({os.path.dirname(path) for path in paths}, key=len):
+            os.makedirs(parent, exist_ok=True)
+        
+        if len(files) >= PARALLEL_WRITE_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+                list(executor.map(self._write_file, paths, files))
+        else:
+            for path, file in zip(paths, files):
+                self._write_file(path, file)
         
-        return created
+        return [Path(path) for path in paths]
     
-    def _create_template_vars(self, spec: ProjectSpec) -> Dict[str, str]:
+    @staticmethod
+    def _write_file(file_path: str, file: GeneratedFile) -> None:
+        """Write one file with an unbuffered open and a single write."""
+        fd = os.open(file_path, _WRITE_FLAGS, 0o777 if file.executable else 0o666)
+        try:
+            _write_all(fd, file.encoded)
+            if file.executable:
+                # Also covers files that already existed, which keep their mode
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, 0o755)
+                else:
+                    os.chmod(file_path, 0o755)
+        finally:
+            os.close(fd)
+    
+    @classmethod
+    def _create_template_vars(cls, spec: ProjectSpec) -> Dict[str, str]:
         """Create template variables from spec."""
-        name_lower = spec.name.lower().replace('-', '_').replace(' ', '_')
-        class_name = ''.join(word.capitalize() for word in spec.name.replace('-', ' ').replace('_', ' ').split())
+        name_lower, class_name = _name_forms(spec.name)
         
         deps_str = ', '.join(f'"{dep}"' for dep in spec.dependencies) if spec.dependencies else ''
         
@@ -459,60 +607,53 @@ services:
             'description': spec.description,
             'dependencies': deps_str,
         }
-    
-    def _scaffold_python(self, spec: ProjectSpec, vars: Dict[str, str]) -> List[GeneratedFile]:
-        """Generate Python project files."""
-        files = []
-        
-        # Get base templates for project type
-        templates = self.PYTHON_TEMPLATES.get('cli', {}).copy()
-        
-        # Merge project type specific templates
-        if spec.project_type in self.PYTHON_TEMPLATES:
-            templates.update(self.PYTHON_TEMPLATES[spec.project_type])
-        
-        # Generate files from templates
-        for path, template in templates.items():
-            content = template.format(**vars)
-            executable = path.endswith('.py') and '#!/' in content
-            files.append(GeneratedFile(path=path, content=content, executable=executable))
-        
-        return files
-    
-    def _scaffold_config(self, spec: ProjectSpec, vars: Dict[str, str]) -> List[GeneratedFile]:
-        """Generate configuration files."""
-        files = []
-        
-        for path, template in self.CONFIG_TEMPLATES.items():
-            content = template.format(**vars)
-            files.append(GeneratedFile(path=path, content=content))
-        
-        return files
-    
-    def _scaffold_ci(self, spec: ProjectSpec, vars: Dict[str, str]) -> List[GeneratedFile]:
-        """Generate CI/CD configuration."""
-        files = []
-        
-        for path, template in self.CI_TEMPLATES.items():
-            content = template.format(**vars)
-            files.append(GeneratedFile(path=path, content=content))
-        
-        return files
-    
-    def _scaffold_docker(self, spec: ProjectSpec, vars: Dict[str, str]) -> List[GeneratedFile]:
-        """Generate Docker configuration."""
-        files = []
-        
-        for path, template in self.DOCKER_TEMPLATES.items():
-            content = template.format(**vars)
-            files.append(GeneratedFile(path=path, content=content))
-        
-        return files
+
+
+# Lowercase words and numbers in a project description
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Runs of anything but letters and digits (hyphens included) in a project name
+_NAME_SEPARATORS_RE = re.compile(r'[\W_]+')
+
+
+def _plurals(*nouns: str) -> frozenset:
+    """Return ``nouns`` plus their regular plural forms."""
+    return frozenset(nouns).union(
+        noun[:-1] + 'ies' if noun.endswith('y') else noun + 's' for noun in nouns
+    )
+
+
+# Keyword tables for parse_project_input, in priority order (first match wins;
+# every matching feature is added). Matching is on whole words, so e.g. "go"
+# does not fire on "good" nor "api" on "rapid"; plurals and other inflections
+# ("servers", "dockerized") are listed as words of their own.
+_LANGUAGE_KEYWORDS = (
+    (frozenset({'javascript', 'node', 'nodejs'}), 'javascript'),
+    (frozenset({'typescript'}), 'typescript'),
+    (frozenset({'go', 'golang'}), 'go'),
+    (frozenset({'rust'}), 'rust'),
+)
+
+_PROJECT_TYPE_KEYWORDS = (
+    (_plurals('api', 'server') | {'rest', 'restful'}, 'api'),
+    (_plurals('frontend', 'website', 'webapp') | {'web'}, 'web'),
+    (_plurals('library', 'lib', 'package'), 'library'),
+)
+
+_FEATURE_KEYWORDS = (
+    (frozenset({'ci', 'github', 'actions'}), 'ci'),
+    (_plurals('docker', 'container', 'dockerfile')
+     | {'dockerized', 'dockerised', 'containerized', 'containerised'}, 'docker'),
+    (frozenset({'docs', 'documentation'}), 'docs'),
+)
 
 
 def parse_project_input(input_text: str) -> ProjectSpec:
     """Parse natural language project description into ProjectSpec.
     
+    Results are memoized per input string; every call returns a fresh copy,
+    so callers are free to mutate it.
+    
     Args:
         input_text: Natural language description like 
                    "Create a Python CLI tool for data processing"
@@ -520,36 +661,37 @@ def parse_project_input(input_text: str) -> ProjectSpec:
     Returns:
         ProjectSpec with parsed information
     """
-    input_lower = input_text.lower()
+    spec = _parse_project_input_cached(input_text)
+    return replace(
+        spec,
+        features=list(spec.features),
+        dependencies=list(spec.dependencies)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_project_input_cached(input_text: str) -> ProjectSpec:
+    """Uncached parser behind ``parse_project_input``; never hand out its result."""
+    # Tokenize once; every keyword check below is a set test
+    tokens = frozenset(_WORD_RE.findall(input_text.lower()))
     
     # Detect language
-    language = 'python'  # Default
-    if 'javascript' in input_lower or 'node' in input_lower:
-        language = 'javascript'
-    elif 'typescript' in input_lower:
-        language = 'typescript'
-    elif 'go' in input_lower or 'golang' in input_lower:
-        language = 'go'
-    elif 'rust' in input_lower:
-        language = 'rust'
+    language = next(
+        (lang for keywords, lang in _LANGUAGE_KEYWORDS if not tokens.isdisjoint(keywords)),
+        'python'  # Default
+    )
     
     # Detect project type
-    project_type = 'cli'  # Default
-    if 'api' in input_lower or 'rest' in input_lower or 'server' in input_lower:
-        project_type = 'api'
-    elif 'web' in input_lower or 'frontend' in input_lower:
-        project_type = 'web'
-    elif 'library' in input_lower or 'lib' in input_lower or 'package' in input_lower:
-        project_type = 'library'
+    project_type = next(
+        (ptype for keywords, ptype in _PROJECT_TYPE_KEYWORDS if not tokens.isdisjoint(keywords)),
+        'cli'  # Default
+    )
     
     # Detect features
     features = ['testing']  # Always include testing
-    if 'ci' in input_lower or 'github' in input_lower or 'actions' in input_lower:
-        features.append('ci')
-    if 'docker' in input_lower or 'container' in input_lower:
-        features.append('docker')
-    if 'docs' in input_lower or 'documentation' in input_lower:
-        features.append('docs')
+    features.extend(
+        feature for keywords, feature in _FEATURE_KEYWORDS if not tokens.isdisjoint(keywords)
+    )
     
     # Extract name (improved heuristic)
     words = input_text.split()
@@ -581,8 +723,8 @@ def parse_project_input(input_text: str) -> ProjectSpec:
             name = f"my-{project_type}"
     
     # Ensure name is valid (alphanumeric and hyphens only)
-    name = ''.join(c if c.isalnum() or c == '-' else '-' for c in name)
-    name = '-'.join(part for part in name.split('-') if part)  # Remove empty parts
+    # Each run of other characters becomes one hyphen; no leading/trailing ones
+    name = _NAME_SEPARATORS_RE.sub('-', name).strip('-')
     
     if not name:
         name = 'my-project'
@@ -1,34 +1,50 @@
 """LLM client for OpenAI and Anthropic integration."""
 
-from typing import Literal, Optional, Dict, Any
+import functools
+import json
+from typing import Literal, Optional, Dict, Any, Iterator, Union
 
 Provider = Literal["openai", "anthropic"]
 Mode = Literal["plan", "code", "reflect"]
 
+# Rendered context for prompts that have none
+_EMPTY_CTX = "{}"
+
+
+@functools.lru_cache(maxsize=2)
+def _get_client(provider: Provider) -> Any:
+    """Return the process-wide SDK client for ``provider``.
+
+    The SDK is imported and its client (with its HTTP connection pool) built
+    on first use only, then shared by every ``LLMClient`` for that provider.
+    Failures are not cached, so a missing key or SDK is retried next time.
+    """
+    if provider == "openai":
+        import openai
+        return openai.Client()
+    if provider == "anthropic":
+        import anthropic
+        return anthropic.Anthropic()
+    raise ValueError(f"Unknown provider: {provider}")
+
 
 class LLMClient:
+    _SYS_CODE = "You are an expert software engineer. Output only code unless asked otherwise."
+    _SYS_REFLECT = "You are a debugging assistant. Given an error and context, propose specific code or command fixes."
+    _SYS_PLAN = "You are a project architect. Given the current state, propose 3–5 concrete next steps with commands."
+
     def __init__(self, provider: Provider, plan_model: str, code_model: str, reflect_model: Optional[str] = None) -> None:
         self.provider = provider
         self.plan_model = plan_model
         self.code_model = code_model
         self.reflect_model = reflect_model or plan_model
-        self._init_clients()
-
-    def _init_clients(self) -> None:
-        if self.provider == "openai":
-            import openai
-            self._client = openai.Client()
-        elif self.provider == "anthropic":
-            import anthropic
-            self._client = anthropic.Anthropic()
-        else:
-            raise ValueError(f"Unknown provider: {self.provider}")
+        self._client = _get_client(provider)
+        self._model_by_mode = {"plan": plan_model, "code": code_model, "reflect": self.reflect_model}
+        self._dispatch = self._call_openai if provider == "openai" else self._call_anthropic
+        self._stream_dispatch = self._stream_openai if provider == "openai" else self._stream_anthropic
 
     def _choose_model(self, mode: Mode) -> str:
-        if mode == "plan": return self.plan_model
-        if mode == "code": return self.code_model
-        if mode == "reflect": return self.reflect_model
-        return self.plan_model
+        return self._model_by_mode.get(mode, self.plan_model)
 
     def _call_openai(self, model: str, system: str, user: str) -> str:
         resp = self._client.chat.completions.create(
@@ -44,24 +60,44 @@ class LLMClient:
             system=system,
             messages=[{"role": "user", "content": user}],
         )
-        return "".join(getattr(block, "text", "") for block in resp.content)
+        return "".join([getattr(block, "text", "") for block in resp.content])
+
+    def _stream_openai(self, model: str, system: str, user: str) -> Iterator[str]:
+        chunks = self._client.chat.completions.create(
+            model=model,
+            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+            stream=True,
+        )
+        for chunk in chunks:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta: yield delta
+
+    def _stream_anthropic(self, model: str, system: str, user: str) -> Iterator[str]:
+        with self._client.messages.stream(
+            model=model,
+            max_tokens=2048,
+            system=system,
+            messages=[{"role": "user", "content": user}],
+        ) as stream:
+            yield from stream.text_stream
+
+    def _stream(self, mode: Mode, system: str, user: str) -> Iterator[str]:
+        return self._stream_dispatch(self._model_by_mode.get(mode, self.plan_model), system, user)
 
     def _call(self, mode: Mode, system: str, user: str) -> str:
-        model = self._choose_model(mode)
-        if self.provider == "openai": return self._call_openai(model, system, user)
-        elif self.provider == "anthropic": return self._call_anthropic(model, system, user)
-        raise RuntimeError("Unsupported provider")
-
-    def generate_code(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
-        system = "You are an expert software engineer. Output only code unless asked otherwise."
-        if context: system += "\n\nProject context:\n" + str(context)
+        # The provider was validated by _get_client in __init__
+        return self._dispatch(self._model_by_mode.get(mode, self.plan_model), system, user)
+
+    def generate_code(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                      stream: bool = False) -> Union[str, Iterator[str]]:
+        system = f"{self._SYS_CODE}\n\nProject context:\n{context}" if context else self._SYS_CODE
+        if stream: return self._stream("code", system, prompt)
         return self._call("code", system, prompt)
 
     def analyze_error(self, stderr: str, context: Optional[Dict[str, Any]] = None) -> str:
-        system = "You are a debugging assistant. Given an error and context, propose specific code or command fixes."
-        user = f"Error:\n{stderr}\n\nContext:\n{context or {}}"
-        return self._call("reflect", system, user)
+        ctx = json.dumps(context, default=str) if context else _EMPTY_CTX
+        user = f"Error:\n{stderr}\n\nContext:\n{ctx}"
+        return self._call("reflect", self._SYS_REFLECT, user)
 
     def plan_next_steps(self, state_summary: str) -> str:
-        system = "You are a project architect. Given the current state, propose 3–5 concrete next steps with commands."
-        return self._call("plan", system, state_summary)
+        return self._call("plan", self._SYS_PLAN, state_summary)
@@ -4,18 +4,33 @@ This module provides the complete autonomous project generation pipeline
 that takes input, generates projects, tests them, and debugs issues.
 """
 
+import copy
+import functools
 import os
 import sys
 import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from datetime import datetime
 
+from vibecoder.core.analyzer import IGNORE_DIRS
+from vibecoder.core.scaffolder import parse_project_input, ProjectScaffolder
+from vibecoder.runtime.test_runner import TestRunner, TestStatus, DebugLoop, verify_project
 
-class PipelineStage(Enum):
-    """Stages of the project generation pipeline."""
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class PipelineStage(str, Enum):
+    """Stages of the project generation pipeline.
+    
+    Members are also their string values, so they can be serialized and
+    used with ``str`` methods directly; use ``.value`` when formatting.
+    """
     INPUT = "input"
     SCAFFOLD = "scaffold"
     GENERATE = "generate"
@@ -26,12 +41,39 @@ class PipelineStage(Enum):
     FAILED = "failed"
 
 
+def _tree_fingerprint(root: str) -> frozenset:
+    """Fingerprint a project tree as its set of ``(path, mtime_ns, size)``.
+    
+    Cache and VCS directories (``IGNORE_DIRS``) are not descended into, so
+    running a project's tests does not by itself change the fingerprint.
+    Every entry's size is recorded alongside its mtime, so an edit is seen
+    even when it keeps the entry count and lands within the filesystem's
+    timestamp granularity.
+    """
+    root_stat = os.stat(root)
+    entries = {(root, root_stat.st_mtime_ns, root_stat.st_size)}
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.name in IGNORE_DIRS:
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    entries.add((entry.path, st.st_mtime_ns, st.st_size))
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return frozenset(entries)
+
+
 def _default_timestamp() -> str:
     """Generate default timestamp for pipeline state."""
     return datetime.now().isoformat()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PipelineState:
     """State of the generation pipeline."""
     stage: PipelineStage
@@ -42,10 +84,14 @@ class PipelineState:
     generated_files: List[str] = field(default_factory=list)
     test_results: Dict = field(default_factory=dict)
     started_at: str = field(default_factory=_default_timestamp)
-    completed_at: str = None
+    completed_at: Optional[str] = None
 
 
-@dataclass
+# PipelineState field names, for serializing without dataclasses.asdict
+_STATE_FIELDS = tuple(f.name for f in fields(PipelineState))
+
+
+@dataclass(**_SLOTS)
 class HumanConfirmation:
     """Request for human confirmation of an action."""
     action: str
@@ -60,19 +106,23 @@ class ProjectPipeline:
     
     MAX_DEBUG_ITERATIONS = 5
     
-    def __init__(self, output_dir: Path, llm_client=None, interactive: bool = True):
+    def __init__(self, output_dir: Path, llm_client=None, interactive: bool = True,
+                 collect_confirmations: bool = False):
         """Initialize the pipeline.
         
         Args:
             output_dir: Directory where generated projects will be created
             llm_client: Optional LLM client for code generation
             interactive: Whether to prompt for human confirmation
+            collect_confirmations: Record each confirmation request in
+                ``pending_confirmations``
         """
         self.output_dir = Path(output_dir)
         self.llm_client = llm_client
         self.interactive = interactive
         self.state = None
         self.pending_confirmations = []
+        self._collect_confirmations = collect_confirmations
     
     def generate_project(self, input_spec: str) -> PipelineState:
         """Generate a complete project from input specification.
@@ -85,9 +135,6 @@ class ProjectPipeline:
         Returns:
             Final pipeline state
         """
-        from vibecoder.core.scaffolder import parse_project_input, ProjectScaffolder
-        from vibecoder.runtime.test_runner import TestRunner, DebugLoop, verify_project
-        
         # Initialize state
         self.state = PipelineState(
             stage=PipelineStage.INPUT,
@@ -99,7 +146,7 @@ class ProjectPipeline:
             self._log("Parsing project specification...")
             spec = parse_project_input(input_spec)
             self.state.project_name = spec.name
-            self.state.project_dir = str(self.output_dir / spec.name)
+            self.state.project_dir = os.path.join(self.output_dir, spec.name)
             
             # Request confirmation for project creation
             if self.interactive:
@@ -123,8 +170,8 @@ class ProjectPipeline:
             self.state.stage = PipelineStage.SCAFFOLD
             self._log(f"Scaffolding {spec.language} {spec.project_type} project...")
             
-            project_dir = Path(self.state.project_dir)
-            project_dir.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.state.project_dir, exist_ok=True)
+            project_dir = Path(self.state.project_dir)  # for the scaffolder/test APIs
             
             scaffolder = ProjectScaffolder(project_dir)
             files = scaffolder.scaffold(spec)
@@ -150,7 +197,7 @@ class ProjectPipeline:
             }
             
             # Stage 5: Debug if needed
-            if test_result.status.value != 'passed':
+            if test_result.status != TestStatus.PASSED:
                 self.state.stage = PipelineStage.DEBUG
                 self._log("Tests failed, entering debug loop...")
                 
@@ -170,11 +217,19 @@ class ProjectPipeline:
             self.state.stage = PipelineStage.VERIFY
             self._log("Verifying project...")
             
-            verification = verify_project(project_dir)
+            # Passing tests were untouched since the TEST stage, so reuse that
+            # run; after the debug loop the suite has to run again
+            if test_result.status == TestStatus.PASSED:
+                verification = verify_project(project_dir, test_result=test_result)
+            else:
+                verification = verify_project(project_dir)
             
             if verification['issues']:
+                # Set membership instead of rescanning the errors list per issue
+                seen = set(self.state.errors)
                 for issue in verification['issues']:
-                    if issue not in self.state.errors:
+                    if issue not in seen:
+                        seen.add(issue)
                         self.state.errors.append(issue)
             
             # Complete
@@ -185,19 +240,26 @@ class ProjectPipeline:
                 self.state.stage = PipelineStage.FAILED
                 self._log(f"Project generation completed with issues: {self.state.errors}")
             
-            self.state.completed_at = datetime.now().isoformat()
             return self.state
             
         except Exception as e:
             self.state.stage = PipelineStage.FAILED
             self.state.errors.append(str(e))
-            self.state.completed_at = datetime.now().isoformat()
             return self.state
+        
+        finally:
+            # Every exit (including a cancelled confirmation) is stamped here
+            self.state.completed_at = datetime.now().isoformat()
     
     def _log(self, message: str):
         """Log pipeline progress."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] [{self.state.stage.value.upper()}] {message}")
+        # localtime() fields are cheaper than datetime.now().strftime(); one
+        # write per line instead of print()'s separate text and newline writes
+        lt = time.localtime()
+        sys.stdout.write(
+            f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}] "
+            f"[{self.state.stage.upper()}] {message}\n"
+        )
     
     def _request_confirmation(
         self, 
@@ -222,31 +284,28 @@ class ProjectPipeline:
         if not self.interactive:
             return options[0]  # Auto-confirm first option
         
-        confirmation = HumanConfirmation(
-            action=action,
-            description=description,
-            details=details,
-            options=options
-        )
-        
-        self.pending_confirmations.append(confirmation)
-        
-        # Display confirmation request
-        print("\n" + "=" * 60)
-        print("HUMAN CONFIRMATION REQUIRED")
-        print("=" * 60)
-        print(f"\nAction: {action}")
-        print(f"Description: {description}")
-        print("\nDetails:")
-        for key, value in details.items():
-            print(f"  {key}: {value}")
-        print(f"\nOptions: {', '.join(options)}")
+        if self._collect_confirmations:
+            self.pending_confirmations.append(HumanConfirmation(
+                action=action,
+                description=description,
+                details=details,
+                options=options
+            ))
         
         # For now, auto-confirm to enable autonomous operation
         # In a real deployment, this would wait for human input
         response = options[0]  # Auto-confirm
-        print(f"Auto-confirming: {response}")
-        print("=" * 60 + "\n")
+        
+        # Display confirmation request in a single write
+        rule = "=" * 60
+        detail_lines = "".join(f"  {key}: {value}\n" for key, value in details.items())
+        sys.stdout.write(
+            f"\n{rule}\nHUMAN CONFIRMATION REQUIRED\n{rule}\n"
+            f"\nAction: {action}\nDescription: {description}\n"
+            f"\nDetails:\n{detail_lines}"
+            f"\nOptions: {', '.join(options)}\n"
+            f"Auto-confirming: {response}\n{rule}\n\n"
+        )
         
         return response
     
@@ -255,32 +314,34 @@ class ProjectPipeline:
         if not self.state:
             return "Pipeline not started"
         
-        summary = [
-            f"Project: {self.state.project_name}",
-            f"Stage: {self.state.stage.value}",
-            f"Directory: {self.state.project_dir}",
-            f"Files Generated: {len(self.state.generated_files)}",
-            f"Debug Iterations: {self.state.iterations}",
-        ]
+        state = self.state
+        summary = (
+            f"Project: {state.project_name}\n"
+            f"Stage: {state.stage.value}\n"
+            f"Directory: {state.project_dir}\n"
+            f"Files Generated: {len(state.generated_files)}\n"
+            f"Debug Iterations: {state.iterations}"
+        )
         
-        if self.state.test_results:
-            summary.append(f"Tests: {self.state.test_results.get('status', 'unknown')}")
+        if state.test_results:
+            summary += f"\nTests: {state.test_results.get('status', 'unknown')}"
         
-        if self.state.errors:
-            summary.append(f"Issues: {len(self.state.errors)}")
-            for err in self.state.errors[:3]:
-                summary.append(f"  - {err[:50]}...")
+        if state.errors:
+            summary += f"\nIssues: {len(state.errors)}"
+            summary += "".join([f"\n  - {err[:50]}..." for err in state.errors[:3]])
         
-        return "\n".join(summary)
+        return summary
     
     def to_json(self) -> str:
         """Export pipeline state as JSON."""
         if not self.state:
             return "{}"
         
-        state_dict = asdict(self.state)
-        state_dict['stage'] = self.state.stage.value
-        return json.dumps(state_dict, indent=2)
+        # One shallow pass: asdict() deep-copies every field just to serialize
+        # it. The stage needs no conversion; it is a str-valued enum.
+        state = self.state
+        state_dict = {name: getattr(state, name) for name in _STATE_FIELDS}
+        return json.dumps(state_dict, indent=2, default=str)
 
 
 class VibeCoderPipeline:
@@ -299,6 +360,8 @@ class VibeCoderPipeline:
         self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "generated_projects"
         self.llm_client = llm_client
         self.history = []
+        # project dir -> (tree fingerprint after verification, report)
+        self._verify_cache: Dict[str, tuple] = {}
     
     def create(self, description: str, interactive: bool = False) -> Dict[str, Any]:
         """Create a new project from description.
@@ -317,6 +380,8 @@ class VibeCoderPipeline:
         )
         
         state = pipeline.generate_project(description)
+        if state.project_dir:
+            self._verify_cache.pop(state.project_dir, None)
         
         result = {
             'success': state.stage == PipelineStage.COMPLETE,
@@ -333,23 +398,38 @@ class VibeCoderPipeline:
     
     def list_projects(self) -> List[str]:
         """List generated projects."""
-        if not self.output_dir.exists():
+        try:
+            with os.scandir(self.output_dir) as it:
+                # is_dir() uses the cached d_type; only symlinks cost a stat
+                return [entry.name for entry in it if entry.is_dir()]
+        except FileNotFoundError:
             return []
-        return [d.name for d in self.output_dir.iterdir() if d.is_dir()]
     
     def get_project_status(self, project_name: str) -> Dict:
-        """Get status of a specific project."""
-        from vibecoder.runtime.test_runner import verify_project
+        """Get status of a specific project.
         
-        project_dir = self.output_dir / project_name
-        if not project_dir.exists():
+        Reports are cached per project directory and reused while its tree
+        fingerprint (every entry's mtime and size) is unchanged, so polling
+        an untouched project does not rerun its tests. Each call returns its
+        own copy of the report.
+        """
+        project_dir = os.path.join(self.output_dir, project_name)
+        if not os.path.exists(project_dir):
             return {'error': 'Project not found'}
         
-        return verify_project(project_dir)
+        cached = self._verify_cache.get(project_dir)
+        if cached is not None and cached[0] == _tree_fingerprint(project_dir):
+            return copy.deepcopy(cached[1])
+        
+        report = verify_project(Path(project_dir))
+        # Fingerprint after verifying, so files its test run touched count
+        self._verify_cache[project_dir] = (_tree_fingerprint(project_dir), report)
+        return copy.deepcopy(report)
 
 
-def run_pipeline_cli():
-    """CLI interface for the project pipeline."""
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the ``run_pipeline_cli`` argument parser once per process."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -405,6 +485,13 @@ Examples:
         help='Output results as JSON'
     )
     
+    return parser
+
+
+def run_pipeline_cli():
+    """CLI interface for the project pipeline."""
+    parser = _get_parser()
+    
     args = parser.parse_args()
     
     pipeline = VibeCoderPipeline(output_dir=args.output)
@@ -437,7 +524,10 @@ Examples:
     result = pipeline.create(args.description, interactive=args.interactive)
     
     if args.json:
-        print(json.dumps(result, indent=2))
+        # Indented output is encoded in Python either way; stream it to
+        # stdout rather than building the whole string first
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         print("\n" + "=" * 60)
         print("PROJECT GENERATION RESULT")
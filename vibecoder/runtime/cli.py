@@ -1,32 +1,52 @@
 """Main CLI and VibeCoder class."""
 
+import contextlib
+import functools
+import io
 import os
 import sys
 import json
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
 from dataclasses import asdict
 
 from vibecoder.core.output import DirectiveOutput
 from vibecoder.core.analyzer import (
     EnvironmentState,
     CodebaseAnalyzer,
-    EMPTINESS_IGNORED_FILES
+    EMPTINESS_IGNORED_FILES,
+    STATE_EMPTY,
+    STATE_VALUES
 )
-from vibecoder.core.planner import SelfImprovementPlanner
 from vibecoder.runtime.state import VibeLog
-from vibecoder.runtime.executor import execute_command
-from vibecoder.llm.client import LLMClient
+
+# The planner, executor and LLM client are imported where they are used, so
+# runs that never reach those branches skip loading them
+if TYPE_CHECKING:
+    from vibecoder.llm.client import LLMClient
+
+# Separator lines for format_output, built once
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
+_SHORT_RULE = "-" * 40
+
+# Environment variables the generated directives expect to be configured
+REQUIRED_API_KEYS = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GITHUB_TOKEN')
+
+OutputFormat = Literal["text", "json", "both"]
 
 
 class VibeCoder:
     """Main autonomous coding entity."""
     
-    def __init__(self, work_dir: Optional[str] = None, llm_client: Optional[LLMClient] = None, auto_execute: bool = False):
+    def __init__(self, work_dir: Optional[str] = None, llm_client: Optional["LLMClient"] = None, auto_execute: bool = False):
         self.work_dir = Path(work_dir) if work_dir else Path.cwd()
         self.state = None
         self.analysis_results = None
-        self.required_api_keys = ['OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GITHUB_TOKEN']
+        self.required_api_keys = REQUIRED_API_KEYS
+        self._missing_api_keys: Optional[List[str]] = None  # None until checked
+        self._api_key_directive: Optional[DirectiveOutput] = None
         self.vibe_log = VibeLog(self.work_dir)
         self.llm_client = llm_client
         self.auto_execute = auto_execute
@@ -36,33 +56,45 @@ class VibeCoder:
             self.vibe_log.read()
     
     def determine_environment_state(self) -> EnvironmentState:
-        """Determine if environment is empty or populated."""
-        # Ignore certain files for emptiness check
-        files = [f for f in self.work_dir.iterdir() 
-                if f.name.lower() not in EMPTINESS_IGNORED_FILES and not f.name.startswith('.')]
+        """Determine if environment is empty or populated.
         
-        # If only README.md or similar docs exist, consider it empty
-        if len(files) <= 1 and any(f.name.lower() in EMPTINESS_IGNORED_FILES for f in files):
-            return EnvironmentState.EMPTY
-        elif len(files) == 0:
-            return EnvironmentState.EMPTY
-        else:
-            return EnvironmentState.POPULATED
+        The directory counts as empty when it only holds hidden entries and
+        docs such as README.md; the scan stops at the first other entry.
+        """
+        with os.scandir(self.work_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.') or name.lower() in EMPTINESS_IGNORED_FILES:
+                    continue
+                return EnvironmentState.POPULATED
+        return EnvironmentState.EMPTY
     
-    def demand_api_keys(self) -> DirectiveOutput:
-        """Generate directive to demand API keys."""
-        missing_keys = [key for key in self.required_api_keys if not os.getenv(key)]
+    def demand_api_keys(self) -> Optional[DirectiveOutput]:
+        """Generate directive to demand API keys.
         
-        if missing_keys:
-            env_template = "\n".join([f"export {key}='your-key-here'" for key in missing_keys])
-            return DirectiveOutput(
-                directive_type="command",
-                content=f"# Required API Keys - Execute these commands:\n{env_template}",
-                description=f"DIRECTIVE: Configure {len(missing_keys)} required API keys as environment variables",
-                priority=0,
-                requires_api_keys=missing_keys
-            )
-        return None
+        The environment is checked once per instance and the (frozen)
+        directive reused; call ``invalidate_api_key_cache`` after changing
+        the environment.
+        """
+        if self._missing_api_keys is None:
+            missing_keys = [key for key in self.required_api_keys if not os.environ.get(key)]
+            self._missing_api_keys = missing_keys
+            
+            if missing_keys:
+                env_template = "\n".join([f"export {key}='your-key-here'" for key in missing_keys])
+                self._api_key_directive = DirectiveOutput(
+                    directive_type="command",
+                    content=f"# Required API Keys - Execute these commands:\n{env_template}",
+                    description=f"DIRECTIVE: Configure {len(missing_keys)} required API keys as environment variables",
+                    priority=0,
+                    requires_api_keys=tuple(missing_keys)
+                )
+        return self._api_key_directive
+    
+    def invalidate_api_key_cache(self):
+        """Forget the cached API key check so the next call re-reads the environment."""
+        self._missing_api_keys = None
+        self._api_key_directive = None
     
     def analyze_environment(self):
         """Analyze current environment and determine actions."""
@@ -73,12 +105,17 @@ class VibeCoder:
             self.analysis_results = analyzer.analyze()
         else:
             self.analysis_results = {
-                "state": EnvironmentState.EMPTY.value,
+                "state": STATE_EMPTY,
                 "message": "Environment is empty - ready for initialization"
             }
     
     def generate_directives(self) -> List[DirectiveOutput]:
-        """Generate directives based on environment analysis."""
+        """Generate directives based on environment analysis.
+        
+        Directives come back ordered by priority. The API key directive
+        (priority 0) goes first and every later group is ordered as it is
+        built, so the full list is never re-sorted.
+        """
         directives = []
         
         # Always check for API keys first
@@ -88,84 +125,109 @@ class VibeCoder:
         
         if self.state == EnvironmentState.EMPTY:
             # Generate self-improvement plan
+            from vibecoder.core.planner import SelfImprovementPlanner
+            
             planner = SelfImprovementPlanner(self.work_dir)
-            directives.extend(planner.create_plan())
+            directives.extend(sorted(planner.create_plan(), key=attrgetter('priority')))
         
         elif self.state == EnvironmentState.POPULATED:
-            # Generate optimization directives
+            # Generate optimization directives; vectors only map to priority
+            # 1 (high) or 2, so bucket them in order instead of sorting
             if self.analysis_results.get('optimization_vectors'):
+                high, normal = [], []
                 for vector in self.analysis_results['optimization_vectors']:
-                    directives.append(DirectiveOutput(
+                    is_high = vector['priority'] == 'high'
+                    (high if is_high else normal).append(DirectiveOutput(
                         directive_type="code",
                         content=f"Optimization: {vector['type']}",
                         description=f"DIRECTIVE [{vector['priority'].upper()}]: {vector['description']}",
-                        priority=1 if vector['priority'] == 'high' else 2
+                        priority=1 if is_high else 2
                     ))
+                directives += high
+                directives += normal
         
-        return sorted(directives, key=lambda x: x.priority)
+        return directives
     
     def format_output(self, directives: List[DirectiveOutput]) -> str:
         """Format directives for terminal output."""
-        output = []
-        output.append("=" * 80)
-        output.append("VIBECODER-ZERO: AUTONOMOUS SOFTWARE GENERATION ENTITY")
-        output.append("=" * 80)
-        output.append("")
+        buf = io.StringIO()
+        self._emit_output(directives, buf.write)
+        return buf.getvalue()
+    
+    def _emit_output(self, directives: List[DirectiveOutput], w: Callable[[str], Any]):
+        """Write the ``format_output`` report piece by piece through ``w``.
+        
+        Lets ``execute`` stream the report to stdout as it is produced (e.g.
+        while auto-executed commands run) instead of rendering it first.
+        """
+        w(f"{_RULE}\nVIBECODER-ZERO: AUTONOMOUS SOFTWARE GENERATION ENTITY\n{_RULE}\n\n")
         
         # Environment analysis
-        output.append("ENVIRONMENT ANALYSIS:")
-        output.append(f"  State: {self.state.value.upper()}")
-        output.append(f"  Working Directory: {self.work_dir}")
+        w("ENVIRONMENT ANALYSIS:\n")
+        w(f"  State: {STATE_VALUES[self.state].upper()}\n")
+        w(f"  Working Directory: {self.work_dir}\n")
         
         if self.state == EnvironmentState.POPULATED and self.analysis_results:
-            output.append(f"  Files: {self.analysis_results.get('file_count', 0)}")
-            output.append(f"  Directories: {self.analysis_results.get('dir_count', 0)}")
+            w(f"  Files: {self.analysis_results.get('file_count', 0)}\n")
+            w(f"  Directories: {self.analysis_results.get('dir_count', 0)}\n")
             
             if self.analysis_results.get('languages'):
-                output.append("  Languages Detected:")
+                w("  Languages Detected:\n")
                 for lang, count in sorted(self.analysis_results['languages'].items(), 
                                          key=lambda x: x[1], reverse=True):
-                    output.append(f"    - {lang}: {count} files")
+                    w(f"    - {lang}: {count} files\n")
             
             if self.analysis_results.get('frameworks'):
-                output.append("  Frameworks/Tools:")
+                w("  Frameworks/Tools:\n")
                 for fw in self.analysis_results['frameworks']:
-                    output.append(f"    - {fw}")
+                    w(f"    - {fw}\n")
         
-        output.append("")
-        output.append("-" * 80)
-        output.append("DIRECTIVES (Execute in order):")
-        output.append("-" * 80)
+        w(f"\n{_THIN_RULE}\nDIRECTIVES (Execute in order):\n{_THIN_RULE}\n")
         
         for i, directive in enumerate(directives, 1):
-            output.append(f"\n[DIRECTIVE {i}] Priority: {directive.priority}")
-            output.append(f"Type: {directive.directive_type.upper()}")
-            output.append(f"Description: {directive.description}")
+            w(
+                f"\n[DIRECTIVE {i}] Priority: {directive.priority}\n"
+                f"Type: {directive.directive_type.upper()}\n"
+                f"Description: {directive.description}\n"
+            )
             
             if directive.requires_api_keys:
-                output.append(f"Required API Keys: {', '.join(directive.requires_api_keys)}")
+                w(f"Required API Keys: {', '.join(directive.requires_api_keys)}\n")
             
-            output.append(f"\nExecute:")
-            output.append("-" * 40)
-            output.append(directive.content)
-            output.append("-" * 40)
+            w(f"\nExecute:\n{_SHORT_RULE}\n{directive.content}\n{_SHORT_RULE}\n")
             
             # Auto-execute if enabled
             if self.auto_execute and directive.directive_type == "command":
-                result = execute_command(directive.content, auto=True)
-                if result.stdout:
-                    output.append(f"Output: {result.stdout}")
-                if result.stderr:
-                    output.append(f"Error: {result.stderr}")
+                self._auto_execute(directive, w)
         
-        output.append("\n" + "=" * 80)
-        output.append("END DIRECTIVES - Awaiting execution confirmation")
-        output.append("=" * 80)
+        w(f"\n{_RULE}\nEND DIRECTIVES - Awaiting execution confirmation\n{_RULE}")
+    
+    def _auto_execute(self, directive: DirectiveOutput, w: Callable[[str], Any]):
+        """Run a command directive through the executor and report its output via ``w``."""
+        from vibecoder.runtime.executor import execute_command
         
-        return "\n".join(output)
+        result = execute_command(directive.content, auto=True)
+        # Written in pieces so large command output is not copied into a
+        # fresh f-string first
+        if result.stdout:
+            w("Output: ")
+            w(result.stdout)
+            w("\n")
+        if result.stderr:
+            w("Error: ")
+            w(result.stderr)
+            w("\n")
     
-    def execute(self):
-        """Main execution method."""
+    def execute(self, output_format: OutputFormat = "text"):
+        """Main execution method.
+        
+        Args:
+            output_format: "text" or "both" print the directive report;
+                "json" skips it, leaving serialization to the caller. Safe
+                commands are still auto-executed when enabled, with the
+                executor's notices and command output sent to stderr so
+                stdout stays free for the JSON document.
+        """
         self.analyze_environment()
         
         # Initialize or update vibe_log.md
@@ -179,15 +241,22 @@ class VibeCoder:
             self.vibe_log.update()
         
         directives = self.generate_directives()
-        output = self.format_output(directives)
-        print(output)
+        if output_format != "json":
+            self._emit_output(directives, sys.stdout.write)
+            sys.stdout.write("\n")
+        elif self.auto_execute:
+            with contextlib.redirect_stdout(sys.stderr):
+                for directive in directives:
+                    if directive.directive_type == "command":
+                        self._auto_execute(directive, sys.stderr.write)
         
         # Return directives for programmatic access
         return directives
 
 
-def main():
-    """Entry point for VibeCoder-Zero."""
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the ``main`` argument parser once per process."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -267,11 +336,20 @@ Examples:
         help='Verify a generated project'
     )
     
+    return parser
+
+
+def main():
+    """Entry point for VibeCoder-Zero."""
+    parser = _get_parser()
+    
     args = parser.parse_args()
     
     # Initialize LLM client if API keys are available
     llm_client = None
     if os.getenv('OPENAI_API_KEY'):
+        from vibecoder.llm.client import LLMClient
+        
         try:
             llm_client = LLMClient(
                 provider="openai",
@@ -282,6 +360,8 @@ Examples:
         except Exception as e:
             print(f"Warning: Could not initialize OpenAI client: {e}", file=sys.stderr)
     elif os.getenv('ANTHROPIC_API_KEY'):
+        from vibecoder.llm.client import LLMClient
+        
         try:
             llm_client = LLMClient(
                 provider="anthropic",
@@ -368,15 +448,15 @@ Examples:
     
     # Default mode: analyze environment
     vibecoder = VibeCoder(work_dir=args.work_dir, llm_client=llm_client, auto_execute=args.auto_execute)
-    directives = vibecoder.execute()
+    directives = vibecoder.execute(output_format="json" if args.json else "text")
     
     if args.json:
         json_output = {
-            "state": vibecoder.state.value,
+            "state": STATE_VALUES[vibecoder.state],
             "analysis": vibecoder.analysis_results,
             "directives": [asdict(d) for d in directives]
         }
-        print("\n" + json.dumps(json_output, indent=2))
+        print(json.dumps(json_output, indent=2))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,25 @@
 """Command execution with safety checks."""
 
+import re
 import shlex
 import subprocess
+from typing import List, Optional
 
-SAFE_PREFIXES = ["ls", "pwd", "mkdir", "touch", "git init", "git status", "python -m venv"]
+# Tuple so str.startswith can test every prefix in a single call
+SAFE_PREFIXES = ("ls", "pwd", "mkdir", "touch", "git init", "git status", "python -m venv")
+
+# Shell operators used for command chaining, redirection or substitution
+_UNSAFE_RE = re.compile(r"[;&|><`$()]")
+
+
+def _is_safe_stripped(stripped: str) -> bool:
+    """Safety checks shared by ``is_safe_command`` and ``_parse_and_check``."""
+    # Check for command chaining operators
+    if _UNSAFE_RE.search(stripped):
+        return False
+    
+    # Check if command starts with a safe prefix
+    return stripped.startswith(SAFE_PREFIXES)
 
 
 def is_safe_command(cmd: str) -> bool:
@@ -11,21 +27,30 @@ def is_safe_command(cmd: str) -> bool:
     
     Prevents command chaining by checking for shell operators.
     """
-    stripped = cmd.strip()
-    
-    # Check for command chaining operators
-    dangerous_chars = [';', '&', '|', '>', '<', '`', '$', '(', ')']
-    if any(char in stripped for char in dangerous_chars):
-        return False
+    return _is_safe_stripped(cmd.strip())
+
+
+def _parse_and_check(cmd: str) -> Optional[List[str]]:
+    """Return the argv for a safe command, or None if it must not auto-run.
     
-    # Check if command starts with a safe prefix
-    return any(stripped.startswith(prefix) for prefix in SAFE_PREFIXES)
+    The command is stripped and checked once, then tokenized once; commands
+    that ``shlex`` cannot split (e.g. unbalanced quotes) are treated as unsafe.
+    """
+    stripped = cmd.strip()
+    if not _is_safe_stripped(stripped):
+        return None
+    try:
+        return shlex.split(stripped)
+    except ValueError:
+        return None
 
 
 def execute_command(cmd: str, auto: bool = False) -> subprocess.CompletedProcess:
-    if auto and is_safe_command(cmd):
+    argv = _parse_and_check(cmd) if auto else None
+    if argv is not None:
         print(f"[AUTO-EXEC] {cmd}")
-        return subprocess.run(shlex.split(cmd), text=True, capture_output=True)
+        # Exec the argv directly; no /bin/sh in between
+        return subprocess.run(argv, text=True, capture_output=True)
     else:
         print(f"[MANUAL EXECUTION REQUIRED]\n{cmd}\n")
         return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
@@ -4,14 +4,23 @@ This module provides autonomous test execution and debugging capabilities,
 enabling the system to verify generated code and fix issues automatically.
 """
 
+import contextlib
+import io
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Traceback location patterns, compiled once for every analysis pass
+_FILE_LINE_RE = re.compile(r'File "([^"]+)", line (\d+)')
+_PY_FILE_LINE_RE = re.compile(r'File "([^"]+\.py)", line (\d+)')
+
+
 class TestStatus(Enum):
     """Status of test execution."""
     PASSED = "passed"
@@ -42,6 +51,33 @@ class DebugSuggestion:
     confidence: float  # 0.0 to 1.0
 
 
+class _OutcomeCollector:
+    """Minimal pytest plugin that records outcomes for in-process runs."""
+    
+    def __init__(self):
+        self.details = {
+            'passed': 0,
+            'failed': 0,
+            'skipped': 0,
+            'errors': 0
+        }
+        self.failures = []
+    
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.details['errors'] += 1
+            self.failures.append(report.longreprtext)
+    
+    def pytest_runtest_logreport(self, report):
+        if report.skipped:
+            self.details['skipped'] += 1
+        elif report.failed:
+            self.details['failed' if report.when == 'call' else 'errors'] += 1
+            self.failures.append(f"{report.nodeid}:\n{report.longreprtext}")
+        elif report.when == 'call':
+            self.details['passed'] += 1
+
+
 class TestRunner:
     """Executes tests and captures results."""
     
@@ -91,12 +127,22 @@ class TestRunner:
         
         return None
     
-    def run_tests(self, test_path: Optional[str] = None, verbose: bool = True) -> TestResult:
+    def run_tests(
+        self,
+        test_path: Optional[str] = None,
+        verbose: bool = True,
+        in_process: bool = False
+    ) -> TestResult:
         """Run tests and return results.
         
         Args:
             test_path: Specific test file or directory (optional)
             verbose: Include verbose output
+            in_process: Run Python tests through ``pytest.main()`` in this
+                interpreter instead of spawning a subprocess. ``sys.modules``
+                and ``sys.path`` are restored after the run, but the tests
+                still execute in this process, so only enable it for trusted
+                code.
             
         Returns:
             TestResult with overall status and details
@@ -104,10 +150,10 @@ class TestRunner:
         framework = self.detect_test_framework()
         
         if framework == 'pytest':
-            result = self._run_pytest(test_path, verbose)
+            result = self._run_pytest(test_path, verbose, in_process)
             # If pytest is not installed, fall back to running tests directly
             if 'No module named pytest' in (result.error or '') or 'No module named pytest' in (result.output or ''):
-                return self._run_python_tests(test_path)
+                return self._run_python_tests(test_path, in_process)
             return result
         elif framework == 'unittest':
             return self._run_unittest(test_path, verbose)
@@ -115,10 +161,15 @@ class TestRunner:
             return self._run_jest(test_path, verbose)
         else:
             # Try running test files directly
-            return self._run_python_tests(test_path)
+            return self._run_python_tests(test_path, in_process)
     
-    def _run_pytest(self, test_path: Optional[str], verbose: bool) -> TestResult:
+    def _run_pytest(self, test_path: Optional[str], verbose: bool, in_process: bool = False) -> TestResult:
         """Run pytest and capture results."""
+        if in_process:
+            result = self._run_pytest_in_process(test_path, verbose)
+            if result is not None:
+                return result
+        
         cmd = [sys.executable, '-m', 'pytest']
         
         if verbose:
@@ -162,6 +213,63 @@ class TestRunner:
                 error=str(e)
             )
     
+    def _run_pytest_in_process(self, test_path: Optional[str], verbose: bool) -> Optional[TestResult]:
+        """Run pytest via ``pytest.main()`` without spawning an interpreter.
+        
+        The run happens with the project as the working directory, like the
+        subprocess path. ``sys.modules``, ``sys.path`` and the working
+        directory are snapshotted and restored around it, so modules imported
+        by one project's tests (``src.core``, ``tests.test_core``...) are not
+        reused by the next project's run.
+        
+        Returns:
+            TestResult, or None if pytest is not importable here
+        """
+        try:
+            import pytest
+        except ImportError:
+            return None
+        
+        target = self.project_dir / (test_path or 'tests')
+        args = [
+            '-v' if verbose else '-q',
+            '-p', 'no:cacheprovider',
+            '--import-mode=importlib',
+            '--rootdir', str(self.project_dir),
+            str(target),
+        ]
+        
+        collector = _OutcomeCollector()
+        stdout = io.StringIO()
+        saved_modules = dict(sys.modules)
+        saved_path = list(sys.path)
+        saved_cwd = os.getcwd()
+        try:
+            os.chdir(self.project_dir)
+            with contextlib.redirect_stdout(stdout):
+                exit_code = pytest.main(args, plugins=[collector])
+        except Exception as e:
+            return TestResult(
+                name="pytest",
+                status=TestStatus.ERROR,
+                output=stdout.getvalue(),
+                error=str(e)
+            )
+        finally:
+            for name in [name for name in sys.modules if name not in saved_modules]:
+                del sys.modules[name]
+            sys.modules.update(saved_modules)
+            sys.path[:] = saved_path
+            os.chdir(saved_cwd)
+        
+        return TestResult(
+            name="pytest",
+            status=TestStatus.PASSED if exit_code == 0 else TestStatus.FAILED,
+            output=stdout.getvalue(),
+            error="\n".join(collector.failures),
+            details=collector.details
+        )
+    
     def _run_unittest(self, test_path: Optional[str], verbose: bool) -> TestResult:
         """Run unittest and capture results."""
         cmd = [sys.executable, '-m', 'unittest']
@@ -235,8 +343,26 @@ class TestRunner:
                 error=str(e)
             )
     
-    def _run_python_tests(self, test_path: Optional[str]) -> TestResult:
-        """Run Python test files directly."""
+    def _run_python_tests(
+        self,
+        test_path: Optional[str],
+        in_process: bool = False,
+        runner: Optional[Callable[..., subprocess.CompletedProcess]] = None
+    ) -> TestResult:
+        """Run Python test files directly.
+        
+        Args:
+            test_path: Specific test file or directory (optional)
+            in_process: Prefer an in-process ``pytest.main()`` run
+            runner: ``subprocess.run``-compatible callable used to execute
+                each test file (defaults to ``subprocess.run``)
+            
+        Returns:
+            TestResult with overall status and details
+        """
+        if runner is None:
+            runner = subprocess.run
+        
         tests_dir = self.project_dir / 'tests'
         
         if not tests_dir.exists():
@@ -247,6 +373,11 @@ class TestRunner:
                 error="No tests directory found"
             )
         
+        if in_process:
+            result = self._run_pytest_in_process(test_path, verbose=False)
+            if result is not None:
+                return result
+        
         all_output = []
         all_errors = []
         overall_status = TestStatus.PASSED
@@ -263,7 +394,7 @@ class TestRunner:
         
         for test_file in test_files:
             try:
-                result = subprocess.run(
+                result = runner(
                     [sys.executable, str(test_file)],
                     cwd=self.project_dir,
                     capture_output=True,
@@ -348,6 +479,18 @@ class DebugLoop:
         },
     }
     
+    # All COMMON_ERRORS patterns fused into one alternation; matches are
+    # dispatched on the name of the group that matched (``m.lastgroup``).
+    # Each branch sits in a zero-width lookahead so a match consumes no text
+    # and matches may overlap, like separate searches ("SyntaxError: (.+)"
+    # would otherwise swallow a later "AssertionError" on the same line).
+    # Every pattern starts with its own exception name, so at most one
+    # branch can match at any position.
+    _COMBINED_ERRORS = re.compile('|'.join(
+        f"(?=(?P<{error_type}>{info['pattern']}))"
+        for error_type, info in COMMON_ERRORS.items()
+    ))
+    
     def __init__(self, project_dir: Path, llm_client=None):
         """Initialize debug loop.
         
@@ -424,17 +567,20 @@ class DebugLoop:
     
     def _pattern_analysis(self, error_text: str) -> List[DebugSuggestion]:
         """Analyze errors using pattern matching."""
-        import re
         suggestions = []
         
+        # Single scan over the error text for every known error type
+        matched = {m.lastgroup for m in self._COMBINED_ERRORS.finditer(error_text)}
+        if not matched:
+            return suggestions
+        
+        # Extract file and line info if present
+        file_match = _FILE_LINE_RE.search(error_text)
+        file_path = file_match.group(1) if file_match else ""
+        line_num = int(file_match.group(2)) if file_match else None
+        
         for error_type, info in self.COMMON_ERRORS.items():
-            match = re.search(info['pattern'], error_text)
-            if match:
-                # Extract file and line info if present
-                file_match = re.search(r'File "([^"]+)", line (\d+)', error_text)
-                file_path = file_match.group(1) if file_match else ""
-                line_num = int(file_match.group(2)) if file_match else None
-                
+            if error_type in matched:
                 suggestions.append(DebugSuggestion(
                     file_path=file_path,
                     line_number=line_num,
@@ -467,16 +613,13 @@ class DebugLoop:
     
     def _get_error_context(self, test_result: TestResult) -> Dict:
         """Extract relevant source code context for error analysis."""
-        import re
-        
         context = {
             'test_output': test_result.output[:2000],  # Limit size
             'error': test_result.error[:1000],
         }
         
         # Try to find mentioned files
-        file_pattern = r'File "([^"]+\.py)", line (\d+)'
-        matches = re.findall(file_pattern, test_result.error or test_result.output)
+        matches = _PY_FILE_LINE_RE.findall(test_result.error or test_result.output)
         
         files_content = {}
         for file_path, line_num in matches[:3]:  # Limit to 3 files
@@ -545,11 +688,19 @@ class DebugLoop:
             return False
 
 
-def verify_project(project_dir: Path) -> Dict:
+def verify_project(
+    project_dir: Path,
+    in_process: bool = False,
+    test_result: Optional[TestResult] = None
+) -> Dict:
     """Verify a generated project is complete and working.
     
     Args:
         project_dir: Path to the project
+        in_process: Run the project's tests in this interpreter
+            (see ``TestRunner.run_tests``)
+        test_result: Result of a test run the caller already made on the
+            project as it is now; used instead of running the tests again
         
     Returns:
         Verification report
@@ -581,8 +732,9 @@ def verify_project(project_dir: Path) -> Dict:
     
     # Run tests if they exist
     if report['has_tests']:
-        runner = TestRunner(project_dir)
-        result = runner.run_tests()
+        result = test_result
+        if result is None:
+            result = TestRunner(project_dir).run_tests(in_process=in_process)
         report['tests_pass'] = result.status == TestStatus.PASSED
         report['test_details'] = {
             'status': result.status.value,